@@ -14,6 +14,7 @@ from .screens import (
 from .utils import (
     is_bare_git_repository,
     get_worktree_directories,
+    scan_worktrees,
     get_active_tmux_sessions,
     get_worktree_pr_status,
     check_remote_branch_exists,
@@ -48,6 +49,7 @@ __all__ = [
     "ConfirmDeleteRepositoryScreen",
     "is_bare_git_repository",
     "get_worktree_directories",
+    "scan_worktrees",
     "get_active_tmux_sessions",
     "get_worktree_pr_status",
     "check_remote_branch_exists",
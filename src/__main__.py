@@ -102,8 +102,12 @@ def select_repository_smart() -> Path | None:
     return Path(app.selected_repo) if app.selected_repo else None
 
 
-def main() -> None:
-    """Main entry point with CLI argument parsing and repository selection loop."""
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point with CLI argument parsing and repository selection loop.
+
+    Args:
+        argv: Command-line arguments to parse (defaults to sys.argv[1:])
+    """
     # Parse command-line arguments
     parser = argparse.ArgumentParser(
         prog="grove", description="Git Worktree and Tmux Session Manager"
@@ -123,7 +127,7 @@ def main() -> None:
         help="Target directory name (default: repository name from URL)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle clone command
     if args.command == "clone":
@@ -5,10 +5,13 @@ import time
 from pathlib import Path
 from typing import Any
 
+from textual import work
 from textual.app import App, ComposeResult
-from textual.widgets import Footer, ListView, ListItem, Label
+from textual.widgets import Footer, ListView, ListItem
 from textual.reactive import reactive
+from textual.css.query import NoMatches
 from textual.containers import Vertical, Horizontal
+from textual.worker import get_current_worker
 
 from .widgets import Sidebar, ScrollableContainer, GitStatusDisplay, GitLogDisplay, TmuxPanePreview, MetadataDisplay
 from .screens import WorktreeFormScreen, ConfirmDeleteScreen, PRFormScreen
@@ -17,12 +20,17 @@ from .utils import (
     get_worktree_directories,
     get_active_tmux_sessions,
     get_worktree_pr_status,
+    get_worktree_details,
     check_remote_branch_exists,
+    prime_worktree_git_info,
     create_worktree_with_branch,
+    get_registered_worktrees,
     remove_worktree_with_branch,
     create_or_switch_to_session,
     get_tmux_server,
     session_exists,
+    invalidate_file_cache,
+    invalidate_session_cache,
     is_inside_tmux,
     get_session_name,
 )
@@ -50,7 +58,9 @@ class GroveApp(App):
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
-        yield Sidebar(id='sidebar')
+        # No initial highlight: the "Loading..." row is replaced on mount, and
+        # the launch worktree is highlighted once the rows exist
+        yield Sidebar(id='sidebar', initial_index=None)
         with Vertical(id='body'):
             with ScrollableContainer(id='metadata_container'):
                 yield MetadataDisplay(id="metadata")
@@ -75,9 +85,12 @@ class GroveApp(App):
         # Auto-select the current worktree
         self.auto_select_current_worktree()
 
-    def detect_current_worktree(self) -> str | None:
+    def detect_current_worktree(self, worktrees: list[str] | None = None) -> str | None:
         """Detect which worktree the user was in when launching Grove.
 
+        Args:
+            worktrees: Worktree directory names, if the caller already listed them
+
         Returns:
             The worktree name if detected, None otherwise.
         """
@@ -85,7 +98,8 @@ class GroveApp(App):
         bare_parent = get_repo_path()
 
         # Get list of valid worktrees
-        worktrees = get_worktree_directories()
+        if worktrees is None:
+            worktrees = get_worktree_directories()
         if not worktrees:
             return None
 
@@ -114,7 +128,9 @@ class GroveApp(App):
 
     def auto_select_current_worktree(self) -> None:
         """Auto-select and highlight the worktree the user was in when launching."""
-        detected_worktree = self.detect_current_worktree()
+        # List the worktrees once for both detection and the index lookup
+        worktrees = get_worktree_directories()
+        detected_worktree = self.detect_current_worktree(worktrees)
 
         if detected_worktree is None:
             return
@@ -124,9 +140,6 @@ class GroveApp(App):
         # Sidebar might still be showing "Loading..." - ensure it's refreshed
         sidebar.refresh_directories()
 
-        # Now get the list of worktrees
-        worktrees = get_worktree_directories()
-
         # Find the index of the detected worktree
         try:
             index = worktrees.index(detected_worktree)
@@ -137,7 +150,9 @@ class GroveApp(App):
         # Defer setting the index until after the sidebar has been fully refreshed
         # This ensures the ListView has processed all the append operations
         def set_index() -> None:
-            sidebar.index = index
+            # The launch worktree is only an initial pick; keep any selection made meanwhile
+            if not self.selected_worktree:
+                sidebar.index = index
 
         self.call_after_refresh(set_index)
 
@@ -174,8 +189,12 @@ class GroveApp(App):
 
         metadata_dir.mkdir(parents=True, exist_ok=True)
 
-        if not metadata_file.exists():
-            metadata_file.write_text("")
+        # Exclusive create leaves an existing pr.md untouched without probing for it first
+        try:
+            open(metadata_file, 'x').close()
+            invalidate_file_cache(str(metadata_file))
+        except FileExistsError:
+            pass
 
         return metadata_file
 
@@ -192,11 +211,13 @@ class GroveApp(App):
 
         if not session_exists(server, session_name):
             try:
-                return server.new_session(
+                session = server.new_session(
                     session_name=session_name,
                     start_directory=str(worktree_path),
                     attach=False
                 )
+                invalidate_session_cache()
+                return session
             except Exception as e:
                 self.notify(f"Failed to create tmux session: {str(e)}", severity="error")
                 return None
@@ -298,6 +319,7 @@ class GroveApp(App):
             found_sessions = server.sessions.filter(session_name=session_name)
             if found_sessions:
                 found_sessions[0].kill()
+                invalidate_session_cache()
                 return True
         return False
 
@@ -459,6 +481,7 @@ class GroveApp(App):
                 new_content = 'WORKTREE_PR_PUBLISHED=true\n'
 
             env_file_path.write_text(new_content)
+            invalidate_file_cache(str(env_file_path))
         except Exception as e:
             self.notify(f"Warning: Could not write to .env file: {str(e)}", severity="warning")
 
@@ -517,17 +540,9 @@ class GroveApp(App):
 
     def on_list_view_highlighted(self, message: ListView.Highlighted) -> None:
         """Handle when a worktree is highlighted in the sidebar."""
-        if message.item and message.item.query(Label):
-            label = message.item.query_one(Label)
-            label_text = str(label.content)
-
-            if " " in label_text:
-                if "[bold]PR[/bold]" in label_text:
-                    worktree_name = label_text.split("[/bold]")[-1].strip()
-                else:
-                    worktree_name = label_text.split(" ", 1)[1] if " " in label_text else ""
-
-                self.selected_worktree = worktree_name
+        # Sidebar rows carry their worktree name; placeholder rows have none
+        if message.item and message.item.name:
+            self.selected_worktree = message.item.name
 
     def on_list_view_selected(self, message: ListView.Selected) -> None:
         """Handle when a worktree is selected (Enter pressed) in the sidebar."""
@@ -555,15 +570,46 @@ class GroveApp(App):
 
     def watch_selected_worktree(self, selected_worktree: str) -> None:
         """Update all displays when selected worktree changes."""
-        git_status = self.query_one("#git_status", GitStatusDisplay)
-        git_log = self.query_one("#git_log", GitLogDisplay)
         metadata_display = self.query_one("#metadata", MetadataDisplay)
-        tmux_preview = self.query_one("#tmux_preview", TmuxPanePreview)
-
-        git_status.update_content(selected_worktree)
-        git_log.update_content(selected_worktree)
         metadata_display.update_content(selected_worktree)
-        tmux_preview.update_content(selected_worktree)
+
+        if not selected_worktree:
+            self._show_worktree_details(selected_worktree, None, None, None)
+            return
+
+        # The git and tmux lookups run in a thread so the UI stays responsive
+        self._load_worktree_details(selected_worktree)
+
+    @work(thread=True, exclusive=True, group="worktree-details")
+    def _load_worktree_details(self, worktree_name: str) -> None:
+        """Fetch git status, git log and pane preview for a worktree off the event loop."""
+        status, log_data, preview_data = get_worktree_details(worktree_name)
+
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._show_worktree_details, worktree_name, status, log_data, preview_data)
+
+    def _show_worktree_details(
+        self,
+        worktree_name: str,
+        status: dict[str, list[str]] | None,
+        log_data: dict[str, Any] | None,
+        preview_data: list[dict[str, str | bool]] | str | None,
+    ) -> None:
+        """Fill in the git and tmux panes, dropping results for a worktree no longer selected."""
+        if worktree_name != self.selected_worktree:
+            return
+
+        try:
+            git_status = self.query_one("#git_status", GitStatusDisplay)
+            git_log = self.query_one("#git_log", GitLogDisplay)
+            tmux_preview = self.query_one("#tmux_preview", TmuxPanePreview)
+        except NoMatches:
+            # The panes are gone (e.g. the app is shutting down), so there is nothing to fill in
+            return
+
+        git_status.update_content(worktree_name, status)
+        git_log.update_content(worktree_name, log_data)
+        tmux_preview.update_content(worktree_name, preview_data)
 
     def cleanup_orphaned_worktrees(self) -> None:
         """Clean up worktrees that have published PRs but no remote branch."""
@@ -576,6 +622,9 @@ class GroveApp(App):
 
         orphaned_worktrees: list[str] = []
 
+        # Read every upstream's tracking state in one batch
+        prime_worktree_git_info(list(pr_worktrees))
+
         for worktree_name in pr_worktrees:
             worktree_path = bare_parent / worktree_name
             if not worktree_path.exists():
@@ -588,11 +637,14 @@ class GroveApp(App):
         if not orphaned_worktrees:
             return
 
+        # List registered worktrees once for all removals
+        registered_worktrees = get_registered_worktrees()
+
         # Clean up orphaned worktrees
         for worktree_name in orphaned_worktrees:
             try:
                 # Remove worktree using GitPython (will query git for the branch name)
-                success, error_msg = remove_worktree_with_branch(worktree_name)
+                success, error_msg = remove_worktree_with_branch(worktree_name, registered_worktrees)
 
                 if success:
                     self._kill_tmux_session(get_session_name(worktree_name))
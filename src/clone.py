@@ -1,5 +1,6 @@
 """Repository cloning functionality for Grove."""
 
+import shutil
 import sys
 from pathlib import Path
 from git import Repo
@@ -169,8 +170,6 @@ def _cleanup_failed_clone(target_dir: Path) -> None:
         target_dir: Directory to remove
     """
     if target_dir.exists():
-        import shutil
-
         try:
             shutil.rmtree(target_dir)
         except Exception:
@@ -270,7 +270,9 @@ def get_repo_path() -> Path:
     """Get repository path (returns active repository).
 
     This is the main function used throughout the codebase to replace
-    get_bare_parent() and .bare directory checks.
+    get_bare_parent() and .bare directory checks. It only reads the
+    in-memory active repository (validated once by set_active_repo), so it
+    is cheap to call repeatedly and needs no caching by callers.
 
     Returns:
         Path to repository root (parent of .bare directory)
@@ -1,22 +1,80 @@
 """Utility functions for Git worktree and tmux operations."""
 
-import datetime
 import os
 import shutil
 import subprocess
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from git import Repo
+from typing import TYPE_CHECKING, Any, TypedDict
+from git import Repo, SymbolicReference
 from git.exc import GitCommandError
-import libtmux
+
+if TYPE_CHECKING:
+    import libtmux
 
 from .config import get_repo_path, ConfigError
 
-# Cache for tmux pane preview data to improve performance
-# Structure: {worktree_name: (timestamp, pane_data)}
-_tmux_pane_cache: dict[str, tuple[float, list[dict[str, str | bool]] | str]] = {}
+# Bounded LRU cache for tmux pane preview data to improve performance
+# Structure: {worktree_name: (expires_at, pane_data)}, least recently used first.
+# Expiry uses time.monotonic() so wall-clock jumps don't affect it.
+_tmux_pane_cache: OrderedDict[str, tuple[float, list[dict[str, str | bool]] | str]] = OrderedDict()
 TMUX_PANE_CACHE_TTL = 30.0  # seconds
+TMUX_PANE_ERROR_CACHE_TTL = 2.0  # seconds, for status/error messages
+TMUX_PANE_CACHE_MAXSIZE = 256
+
+# Shared thread pool for fanning out blocking per-worktree git and file I/O
+_IO_POOL = ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 4), thread_name_prefix="grove-io")
+
+# Fields requested per pane from `tmux list-panes -a`, tab separated
+_TMUX_PANE_FORMAT = "#{session_name}\t#{window_index}\t#{window_name}\t#{window_active}\t#{pane_active}\t#{pane_id}"
+
+# Line printed between captured panes when chaining capture-pane commands
+_TMUX_CAPTURE_MARKER = "__grove_capture_boundary__"
+
+# Active tmux session names with the monotonic time they were listed, shared by
+# get_active_tmux_sessions() and session_exists() within a short window
+_session_names_cache: tuple[float, frozenset[str]] | None = None
+SESSION_NAMES_CACHE_TTL = 2.0  # seconds
+
+# Shared tmux server handle, created lazily by get_tmux_server()
+_tmux_server: "libtmux.Server | None" = None
+
+# Whether Grove was launched from inside tmux (TMUX is fixed for the process lifetime)
+_INSIDE_TMUX: bool = 'TMUX' in os.environ
+
+# Home directory, resolved once (last fallback location for .tmux-sessionizer)
+_HOME = Path.home()
+
+# Contents of small per-worktree files (pr.md, .env), keyed by path and
+# validated against (st_mtime_ns, st_size) so unchanged files are only stat'ed
+_file_cache: dict[str, tuple[tuple[int, int], bytes]] = {}
+
+# Paths _read_cached() found missing, with the monotonic time they were probed,
+# so absent .env and pr.md files aren't re-stat'ed on every refresh
+_missing_file_cache: dict[str, float] = {}
+MISSING_FILE_CACHE_TTL = 10.0  # seconds
+
+# GitPython Repo handles per thread, as {path: Repo} least recently used first.
+# A Repo and its `git cat-file` helpers must not be used from two threads at
+# once, and the details worker and _IO_POOL read objects concurrently, so each
+# thread keeps its own handles. The generation lets invalidate_repo_cache()
+# drop every thread's handles.
+_repo_handles = threading.local()
+_repo_generation = 0
+REPO_CACHE_MAXSIZE = 32
+
+# Last-commit info and upstream tracking state per worktree path, filled in
+# bulk by prime_worktree_git_info() with the HEAD commit hash it was read for,
+# and reused for a short time while HEAD still points at that commit
+_worktree_ref_cache: dict[str, tuple[float, str, dict[str, str], str]] = {}
+WORKTREE_REF_CACHE_TTL = 15.0  # seconds
+
+# Fields read per branch by prime_worktree_git_info(), unit-separator delimited
+_WORKTREE_REF_FORMAT = "%(refname)%1f%(subject)%1f%(committerdate:iso)%1f%(authorname) %(authoremail)%1f%(upstream:track)"
 
 # Default return value for git log when no data is available
 _EMPTY_GIT_LOG: dict[str, Any] = {
@@ -27,99 +85,275 @@ _EMPTY_GIT_LOG: dict[str, Any] = {
     "commits": []
 }
 
+# Most recent commits listed per worktree, so log reads and rendering stay
+# bounded no matter how much history the branch has
+GIT_LOG_MAX_COMMITS = 20
+
+
+class WorktreeRow(TypedDict):
+    """A worktree directory as listed in the sidebar."""
+    name: str
+    path: str
+    has_pr: bool
+
 
 def is_bare_git_repository() -> bool:
     """Check if current directory or parent contains a bare git repository."""
-    current_path = Path.cwd()
+    current_path = os.getcwd()
 
-    # Check current directory for .bare subdirectory
-    if (current_path / ".bare").is_dir():
+    # Check current directory for .bare subdirectory (one stat, no directory listing)
+    if os.path.isdir(os.path.join(current_path, ".bare")):
         return True
 
     # Check parent directory for .bare subdirectory
-    if (current_path.parent / ".bare").is_dir():
+    if os.path.isdir(os.path.join(os.path.dirname(current_path), ".bare")):
         return True
 
     return False
 
 
-def get_tmux_server() -> libtmux.Server | None:
-    """Get tmux server instance with error handling."""
-    try:
-        return libtmux.Server()
-    except Exception:
-        return None
+def _repo_for(path_str: str) -> Repo:
+    """Get the calling thread's cached GitPython Repo handle for a path.
+
+    Opening a Repo re-reads the git config and refs, so handles are reused
+    across calls. A handle can also keep `git cat-file` helper processes
+    alive once objects are read through it, so the pool is kept small.
+    Handles are never shared between threads. Call invalidate_repo_cache()
+    after adding or removing worktrees so stale handles are dropped.
+    """
+    handles: OrderedDict[str, Repo] | None = getattr(_repo_handles, "handles", None)
+    if handles is None or _repo_handles.generation != _repo_generation:
+        handles = _repo_handles.handles = OrderedDict()
+        _repo_handles.generation = _repo_generation
+
+    repo = handles.get(path_str)
+    if repo is None:
+        repo = handles[path_str] = Repo(path_str)
+        if len(handles) > REPO_CACHE_MAXSIZE:
+            handles.popitem(last=False)
+    else:
+        handles.move_to_end(path_str)
+    return repo
+
+def invalidate_repo_cache() -> None:
+    """Drop all cached Repo handles, in every thread."""
+    global _repo_generation
+    _repo_generation += 1
+    # Other threads drop theirs on next use; release this thread's right away
+    _repo_handles.handles = None
+
+def invalidate_git_info_cache() -> None:
+    """Drop the bulk-loaded commit info and upstream state."""
+    _worktree_ref_cache.clear()
+
+def invalidate_file_cache(path: str | None = None) -> None:
+    """Drop cached file contents and missing-file entries.
+
+    Args:
+        path: Only forget this file (all files if None)
+    """
+    if path is None:
+        _file_cache.clear()
+        _missing_file_cache.clear()
+    else:
+        _file_cache.pop(path, None)
+        _missing_file_cache.pop(path, None)
+
+def _git(worktree_path: Path | str, *args: str) -> bytes:
+    """Run a git command in a worktree and return its raw stdout.
+
+    Used for read-only queries whose text output is parsed directly, which
+    skips GitPython's command wrapper. Like Repo(), git is stopped from
+    searching parent directories, so a directory that is not itself a
+    worktree fails instead of reporting on an enclosing repository.
+    Optional locks are disabled so `git status` never rewrites the index
+    and can't collide with git commands the user runs in the worktree.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with a non-zero status
+    """
+    worktree_dir = str(worktree_path)
+    return subprocess.run(
+        ['git', '--no-optional-locks', '-C', worktree_dir, *args],
+        capture_output=True,
+        check=True,
+        env={**os.environ, 'GIT_CEILING_DIRECTORIES': os.path.dirname(os.path.abspath(worktree_dir))}
+    ).stdout
+
+def get_tmux_server() -> "libtmux.Server | None":
+    """Get the shared tmux server instance, creating it on first use.
+
+    libtmux is imported here rather than at module level so code paths that
+    never talk to tmux don't pay for loading it.
+    """
+    global _tmux_server
+    if _tmux_server is None:
+        try:
+            import libtmux
+            _tmux_server = libtmux.Server()
+        except Exception:
+            return None
+    return _tmux_server
+
+def reset_tmux_server() -> None:
+    """Drop the shared tmux server so the next call reconnects."""
+    global _tmux_server
+    _tmux_server = None
 
 def is_inside_tmux() -> bool:
     """Check if we're currently inside a tmux session."""
-    return os.environ.get('TMUX') is not None
-
-def session_exists(server: libtmux.Server, session_name: str) -> bool:
+    return _INSIDE_TMUX
+
+def _active_session_names() -> frozenset[str]:
+    """Get active tmux session names, listing them at most once per TTL window."""
+    global _session_names_cache
+    now = time.monotonic()
+    if _session_names_cache is not None and now - _session_names_cache[0] < SESSION_NAMES_CACHE_TTL:
+        return _session_names_cache[1]
+    names = frozenset(_list_tmux_sessions())
+    _session_names_cache = (now, names)
+    return names
+
+def invalidate_session_cache() -> None:
+    """Drop the cached session names after creating or killing a session."""
+    global _session_names_cache
+    _session_names_cache = None
+
+def session_exists(server: "libtmux.Server", session_name: str) -> bool:
     """Check if a tmux session with the given name exists."""
-    try:
-        sessions = server.sessions.filter(session_name=session_name)
-        return len(sessions) > 0
-    except Exception:
-        return False
+    return session_name in _active_session_names()
 
 def get_session_name(worktree_name: str) -> str:
     """Get the full tmux session name for a worktree, prefixed with repo name."""
     repo_name = get_repo_path().name.replace('.', '-')
     return f"{repo_name}/{worktree_name.replace('.', '-')}"
 
-def _run_hydration_script(session: Any, worktree_path: Path, session_name: str) -> None:
+@lru_cache(maxsize=64)
+def _find_hydration_script_dir(worktree_path: Path, worktree_mtime_ns: int, parent_mtime_ns: int) -> Path | None:
+    """Find the directory holding the .tmux-sessionizer script for a worktree.
+
+    Probes the worktree directory, its parent, and the user's home directory
+    (in that order) with one stat each. Results are memoized on the worktree
+    and parent directory mtimes, so adding or removing a script there
+    invalidates the cached lookup.
+
+    Returns:
+        The directory containing the script, or None if no script was found.
+    """
+    for script_dir in (worktree_path, worktree_path.parent, _HOME):
+        try:
+            os.stat(script_dir / ".tmux-sessionizer")
+        except OSError:
+            continue
+        return script_dir
+    return None
+
+def _report_hydration_result(process: subprocess.Popen[bytes], session: Any) -> None:
+    """Wait for a hydration script to exit and show its outcome in the session."""
+    message = "Session hydrated successfully" if process.wait() == 0 else "Session hydration failed"
+    try:
+        session.cmd('display-message', message)
+    except Exception:
+        pass
+
+def _hydration_env(session: Any) -> dict[str, str]:
+    """Build the environment for a hydration script started outside tmux.
+
+    Grove's own TMUX and TMUX_PANE would make untargeted tmux commands in the
+    script act on grove's session and pane. TMUX_PANE is dropped and TMUX is
+    pointed at the new session, as `tmux run-shell` does for its jobs.
+    """
+    env = os.environ.copy()
+    env.pop("TMUX_PANE", None)
+    try:
+        socket_path, server_pid, session_id = session.cmd(
+            'display-message', '-p', '#{socket_path},#{pid},#{session_id}'
+        ).stdout[0].rsplit(',', 2)
+    except Exception:
+        return env
+    env["TMUX"] = f"{socket_path},{server_pid},{session_id.lstrip('$')}"
+    return env
+
+def _run_hydration_script(session: Any, worktree_path: Path) -> None:
     """Find and run .tmux-sessionizer hydration script for a new session.
 
     Searches for the hydration script in the worktree directory, its parent,
-    and the user's home directory (in that order).
-    """
-    hydration_script = None
-    script_dir = None
-
-    if (worktree_path / ".tmux-sessionizer").exists():
-        hydration_script = worktree_path / ".tmux-sessionizer"
-        script_dir = worktree_path
-    elif (worktree_path.parent / ".tmux-sessionizer").exists():
-        hydration_script = worktree_path.parent / ".tmux-sessionizer"
-        script_dir = worktree_path.parent
-    elif (Path.home() / ".tmux-sessionizer").exists():
-        hydration_script = Path.home() / ".tmux-sessionizer"
-        script_dir = Path.home()
-
-    if hydration_script and script_dir:
+    and the user's home directory (in that order). The script is spawned
+    directly in the background rather than through `tmux run-shell`, with an
+    environment that targets the new session, and a watcher thread reports
+    the result with a tmux message once it exits.
+    """
+    try:
+        script_dir = _find_hydration_script_dir(
+            worktree_path,
+            os.stat(worktree_path).st_mtime_ns,
+            os.stat(worktree_path.parent).st_mtime_ns,
+        )
+    except OSError:
+        script_dir = None
+
+    if script_dir is not None:
         try:
-            session.cmd(
-                'run-shell',
-                '-b',
-                '-c', str(script_dir),
-                f"bash '.tmux-sessionizer' && tmux display-message -t '{session_name}' 'Session hydrated successfully' || tmux display-message -t '{session_name}' 'Session hydration failed'"
+            process = subprocess.Popen(
+                ['bash', '.tmux-sessionizer'],
+                cwd=str(script_dir),
+                env=_hydration_env(session),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
-        except Exception:
+        except OSError:
+            return
+        threading.Thread(
+            target=_report_hydration_result,
+            args=(process, session),
+            name="grove-hydration",
+            daemon=True
+        ).start()
+
+def _prepare_new_session(session: Any, worktree_path: Path, bare_parent: Path) -> None:
+    """Create the worktree's metadata files and start hydration for a new session."""
+    try:
+        # Create metadata directory structure if it doesn't exist
+        metadata_dir = bare_parent / ".grove" / "metadata" / worktree_path.name
+        metadata_dir.mkdir(parents=True, exist_ok=True)
+
+        # Create empty pr.md if it doesn't exist (exclusive create, no exists() probe)
+        try:
+            open(metadata_dir / "pr.md", 'x').close()
+            invalidate_file_cache(str(metadata_dir / "pr.md"))
+        except FileExistsError:
             pass
+    except OSError:
+        pass  # Missing metadata shouldn't stop the session from being hydrated
 
-def _setup_new_session(server: libtmux.Server, session_name: str, worktree_path: Path) -> Any:
+    _run_hydration_script(session, worktree_path)
+
+def _setup_new_session(server: "libtmux.Server", session_name: str, worktree_path: Path) -> Any:
     """Create a new tmux session with metadata and run hydration.
 
+    Only the session itself is created synchronously; metadata files and the
+    hydration script are set up on a background thread so switching to the
+    session doesn't wait on them.
+
     Returns the created session object.
     """
+    bare_parent = get_repo_path()
+
     session = server.new_session(
         session_name=session_name,
         start_directory=str(worktree_path),
         attach=False
     )
+    invalidate_session_cache()
 
-    bare_parent = get_repo_path()
-
-    # Create metadata directory structure if it doesn't exist
-    metadata_dir = bare_parent / ".grove" / "metadata" / worktree_path.name
-    metadata_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create empty pr.md if it doesn't exist
-    pr_file = metadata_dir / "pr.md"
-    if not pr_file.exists():
-        pr_file.write_text("")
-
-    _run_hydration_script(session, worktree_path, session_name)
+    threading.Thread(
+        target=_prepare_new_session,
+        args=(session, worktree_path, bare_parent),
+        name="grove-session-setup",
+        daemon=True
+    ).start()
 
     return session
 
@@ -160,6 +394,7 @@ def create_or_switch_to_session(worktree_path: Path) -> tuple[bool, str]:
         return True, ""
 
     except Exception as e:
+        reset_tmux_server()
         return False, f"Tmux error: {str(e)}"
 
 def get_worktree_directories() -> list[str]:
@@ -169,68 +404,142 @@ def get_worktree_directories() -> list[str]:
     except ConfigError:
         return []  # Return empty list if no active repo
 
-    # Get all directories at the same level as .bare, excluding hidden ones
-    directories: list[str] = []
-    for item in bare_parent.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            directories.append(item.name)
-
-    return sorted(directories)
+    # Get all directories at the same level as .bare, excluding hidden ones.
+    # The name check runs first so hidden entries never touch the filesystem,
+    # and DirEntry.is_dir() answers from the listing's d_type; only symlinks
+    # (which are still followed, so linked worktrees keep showing) cost a stat.
+    with os.scandir(bare_parent) as entries:
+        return sorted(entry.name for entry in entries if not entry.name.startswith('.') and entry.is_dir())
 
 def get_active_tmux_sessions() -> set[str]:
-    """Get names of all active tmux sessions using libtmux."""
+    """Get names of all active tmux sessions.
+
+    The listing is shared for SESSION_NAMES_CACHE_TTL seconds so rapid
+    sidebar refreshes don't each spawn tmux; creating or killing a session
+    calls invalidate_session_cache() so the change shows up immediately.
+    """
+    return set(_active_session_names())
+
+def _list_tmux_sessions() -> set[str]:
+    """List active tmux session names with a single `tmux list-sessions` call.
+
+    Only the session name is requested, and tmux is invoked directly rather
+    than through libtmux so no Session objects are built.
+    """
     try:
-        server = get_tmux_server()
-        if server is None:
-            return set()
-        return {session.name for session in server.sessions if session.name is not None}
-    except Exception:
-        return set()
+        result = subprocess.run(
+            ['tmux', 'list-sessions', '-F', '#{session_name}'],
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+    except (OSError, subprocess.SubprocessError):
+        return set()  # tmux not installed or not responding
+
+    if result.returncode != 0 or not result.stdout:
+        return set()  # No tmux server running, or no sessions listed
+
+    return set(result.stdout.splitlines())
+
+def _read_cached(path: str) -> bytes | None:
+    """Read a file's bytes, reusing the cached copy while it is unchanged.
+
+    A single stat() decides whether the cached contents are still valid;
+    the file is only re-read when its mtime or size differs. A missing file
+    isn't probed again for MISSING_FILE_CACHE_TTL seconds unless
+    invalidate_file_cache() is called for it. Takes a plain string path
+    since it is called per worktree on every refresh.
+
+    Returns:
+        The file contents, or None if the file is missing or unreadable
+    """
+    missing_since = _missing_file_cache.get(path)
+    if missing_since is not None and time.monotonic() - missing_since < MISSING_FILE_CACHE_TTL:
+        return None
 
-def get_worktree_pr_status() -> set[str]:
-    """Get names of worktrees that have a PR published."""
+    try:
+        stat_result = os.stat(path)
+        key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = _file_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with open(path, 'rb') as file:
+            content = file.read()
+    except FileNotFoundError:
+        _file_cache.pop(path, None)
+        _missing_file_cache[path] = time.monotonic()
+        return None
+    except OSError:
+        _file_cache.pop(path, None)
+        return None
+    _file_cache[path] = (key, content)
+    return content
+
+def _has_published_pr(worktree_dir: str) -> bool:
+    """Check a worktree's .env file for WORKTREE_PR_PUBLISHED=true."""
+    content = _read_cached(os.path.join(worktree_dir, ".env"))
+    if content is None:
+        return False  # Missing or unreadable .env means no published PR
+
+    # A substring scan rejects most files without splitting them into lines;
+    # the per-line check only confirms the match is a whole (stripped) line
+    if b'WORKTREE_PR_PUBLISHED=true' not in content:
+        return False
+    return any(line.strip() == b'WORKTREE_PR_PUBLISHED=true' for line in content.splitlines())
+
+def scan_worktrees() -> list[WorktreeRow]:
+    """List worktree directories together with their published-PR state.
+
+    Walks the repository directory once and checks each worktree's .env
+    (one stat, re-read only when changed) instead of listing the directories
+    and then probing them separately.
+
+    Returns:
+        Worktree rows sorted by name (empty if there is no active repo)
+    """
     try:
         bare_parent = get_repo_path()
     except ConfigError:
-        return set()  # Return empty set if no active repo
+        return []  # Return empty list if no active repo
 
-    # Check each worktree for .env file with WORKTREE_PR_PUBLISHED=true
-    pr_worktrees: set[str] = set()
-    directories = get_worktree_directories()
+    # Same filtering as get_worktree_directories
+    with os.scandir(bare_parent) as entries:
+        paths = sorted((entry.name, entry.path) for entry in entries if not entry.name.startswith('.') and entry.is_dir())
 
-    for directory in directories:
-        env_file = bare_parent / directory / ".env"
-        if env_file.exists():
-            try:
-                content = env_file.read_text()
-                # Check if WORKTREE_PR_PUBLISHED=true is in the file
-                for line in content.strip().split('\n'):
-                    if line.strip() == 'WORKTREE_PR_PUBLISHED=true':
-                        pr_worktrees.add(directory)
-                        break
-            except (IOError, OSError):
-                pass
+    # Check each worktree for .env file with WORKTREE_PR_PUBLISHED=true (concurrently)
+    published = _IO_POOL.map(lambda name_path: _has_published_pr(name_path[1]), paths)
 
-    return pr_worktrees
+    return [
+        {"name": name, "path": path, "has_pr": is_published}
+        for (name, path), is_published in zip(paths, published)
+    ]
+
+def get_worktree_pr_status() -> set[str]:
+    """Get names of worktrees that have a PR published."""
+    return {row["name"] for row in scan_worktrees() if row["has_pr"]}
 
 def check_remote_branch_exists(worktree_path: Path) -> bool:
     """Check if the remote upstream branch exists for a worktree.
 
-    Returns True if remote branch exists, False if it's gone or there's no upstream.
+    Returns False only if the branch's upstream is gone. Returns True if the
+    upstream exists, there is no upstream, or the state can't be determined.
+    Answers from prime_worktree_git_info() results while they are fresh.
     """
+    primed = _primed_ref_info(str(worktree_path))
+    if primed is not None:
+        return primed[1] != '[gone]'
+
     try:
-        # Open repo and use git status to check if upstream branch is gone
-        repo = Repo(str(worktree_path))
-        status_output = repo.git.status('-b', '--porcelain')
-
-        if status_output:
-            # Check if the first line contains [gone]
-            first_line = status_output.strip().split('\n')[0]
-            if '[gone]' in first_line:
-                return False
-            # If there's tracking info without [gone], the branch exists
-            if '...' in first_line:
-                return True
+        # Resolve the upstream from the branch config and look up its ref in
+        # the loose and packed ref files, all in-process without running git
+        repo = _repo_for(str(worktree_path))
+        if not repo.head.is_detached:
+            upstream = repo.active_branch.tracking_branch()
+            if upstream is not None:
+                try:
+                    upstream.dereference_recursive(repo, upstream.path)
+                except ValueError:
+                    return False  # Upstream configured but its ref is gone
     except Exception:
         pass
 
@@ -244,35 +553,56 @@ def get_worktree_metadata(worktree_name: str) -> str:
     if bare_parent is None:
         return ""
 
-    metadata_dir = bare_parent / ".grove" / "metadata" / worktree_name
-    pr_file = metadata_dir / "pr.md"
+    content = _read_cached(os.path.join(bare_parent, ".grove", "metadata", worktree_name, "pr.md"))
 
-    if pr_file.exists():
-        try:
-            return pr_file.read_text().strip()
-        except (IOError, OSError):
-            return ""
+    if content is None:
+        return ""
 
-    return ""
+    return content.decode(errors='replace').strip()
 
-def get_worktree_git_info(worktree_name: str) -> dict[str, str]:
-    """Get git information for a worktree (last commit message, date, committer)."""
-    bare_parent = get_repo_path()
+def _resolve_head(worktree_path: str) -> str | None:
+    """Resolve a worktree's HEAD to a commit hash in-process from the ref files.
 
-    if bare_parent is None:
-        return {"commit_message": "N/A", "commit_date": "N/A", "committer": "N/A"}
+    Returns:
+        The commit hash, or None for an unborn branch or unreadable refs
+    """
+    try:
+        head_sha: str = SymbolicReference.dereference_recursive(_repo_for(worktree_path), 'HEAD')
+        return head_sha
+    except Exception:
+        return None
 
-    worktree_path = bare_parent / worktree_name
-    if not worktree_path.exists():
-        return {"commit_message": "N/A", "commit_date": "N/A", "committer": "N/A"}
+def _primed_ref_info(worktree_path: str) -> tuple[dict[str, str], str] | None:
+    """Get the prime_worktree_git_info() entry for a worktree if it is still valid.
+
+    An entry is used only while it is fresh, the worktree still exists and
+    HEAD still points at the commit it was read for, so a deleted worktree
+    or a new commit never gets stale info.
 
+    Returns:
+        Tuple of (commit info, upstream tracking state), or None
+    """
+    cached = _worktree_ref_cache.get(worktree_path)
+    if cached is None or time.monotonic() - cached[0] >= WORKTREE_REF_CACHE_TTL:
+        return None
+
+    if not os.path.exists(worktree_path) or _resolve_head(worktree_path) != cached[1]:
+        return None
+
+    return cached[2], cached[3]
+
+def _read_head_commit(worktree_path: str) -> dict[str, str] | None:
+    """Read the last commit's message, date and committer for a worktree.
+
+    Returns:
+        Commit info dict, or None if git fails or the worktree has no commits
+    """
     try:
-        # Get last commit info using GitPython
-        repo = Repo(str(worktree_path))
-        log_output = repo.git.log('-1', '--format=%s%n%ci%n%an <%ae>')
+        # Get last commit info straight from git
+        log_output = _git(worktree_path, 'log', '-1', '--format=%s%n%ci%n%an <%ae>')
 
         if log_output.strip():
-            lines = log_output.strip().split('\n')
+            lines = log_output.strip().decode(errors='replace').split('\n')
             return {
                 "commit_message": lines[0] if len(lines) > 0 else "N/A",
                 "commit_date": lines[1] if len(lines) > 1 else "N/A",
@@ -281,8 +611,130 @@ def get_worktree_git_info(worktree_name: str) -> dict[str, str]:
     except Exception:
         pass
 
+    return None
+
+def prime_worktree_git_info(worktree_names: list[str]) -> None:
+    """Load last-commit info and upstream state for many worktrees at once.
+
+    Maps worktrees to their branches with one `git worktree list` and reads
+    every branch's tip commit and upstream tracking state with one
+    `git for-each-ref`, so get_worktree_git_info and check_remote_branch_exists
+    can answer from memory instead of running git per worktree. Worktrees
+    with a detached HEAD get their `git log` run concurrently instead.
+
+    Args:
+        worktree_names: Names of the worktrees to load
+    """
+    try:
+        bare_dir = os.path.join(get_repo_path(), ".bare")
+        worktree_output = _git(bare_dir, 'worktree', 'list', '--porcelain', '-z')
+        ref_output = _git(bare_dir, 'for-each-ref', f'--format={_WORKTREE_REF_FORMAT}', 'refs/heads')
+
+        # Map each branch ref to its tip commit info and upstream tracking state
+        refs: dict[bytes, tuple[dict[str, str], str]] = {}
+        for record in ref_output.splitlines():
+            refname, subject, date, committer, track = record.split(b'\x1f')
+            refs[refname] = ({
+                "commit_message": subject.decode(errors='replace'),
+                "commit_date": date.decode(),
+                "committer": committer.decode(errors='replace'),
+            }, track.decode())
+
+        # Porcelain records are "key value" fields, each worktree ending in an empty field
+        wanted = set(worktree_names)
+        now = time.monotonic()
+        detached: list[tuple[str, str]] = []
+        worktree_path: bytes | None = None
+        head_sha = ''
+        for field in worktree_output.split(b'\0'):
+            if field.startswith(b'worktree '):
+                worktree_path = field[9:]
+            elif worktree_path is None or os.path.basename(os.fsdecode(worktree_path)) not in wanted:
+                continue
+            elif field.startswith(b'HEAD '):
+                head_sha = field[5:].decode()
+            elif field.startswith(b'branch '):
+                ref = refs.get(field[7:])
+                if ref is not None:
+                    _worktree_ref_cache[os.fsdecode(worktree_path)] = (now, head_sha, ref[0], ref[1])
+            elif field == b'detached':
+                detached.append((os.fsdecode(worktree_path), head_sha))
+
+        # Detached worktrees have no branch ref to read; run their per-worktree
+        # git log calls concurrently on the shared (bounded) I/O pool
+        infos = _IO_POOL.map(_read_head_commit, [path for path, _ in detached])
+        for (path, sha), info in zip(detached, infos):
+            if info is not None:
+                _worktree_ref_cache[path] = (now, sha, info, '')
+    except Exception:
+        pass  # Leave everything to the per-worktree lookups
+
+def get_worktree_git_info(worktree_name: str) -> dict[str, str]:
+    """Get git information for a worktree (last commit message, date, committer).
+
+    Answers from prime_worktree_git_info() results while they are fresh.
+    """
+    bare_parent = get_repo_path()
+
+    if bare_parent is None:
+        return {"commit_message": "N/A", "commit_date": "N/A", "committer": "N/A"}
+
+    worktree_path = os.path.join(bare_parent, worktree_name)
+    if not os.path.exists(worktree_path):
+        return {"commit_message": "N/A", "commit_date": "N/A", "committer": "N/A"}
+
+    primed = _primed_ref_info(worktree_path)
+    if primed is not None:
+        return dict(primed[0])
+
+    info = _read_head_commit(worktree_path)
+    if info is not None:
+        return info
+
     return {"commit_message": "N/A", "commit_date": "N/A", "committer": "N/A"}
 
+# Number of space-separated fields before the path in porcelain v2 status records
+_STATUS_V2_PATH_FIELD: dict[bytes, int] = {b'1': 8, b'2': 9, b'u': 10}
+
+def _parse_git_status_v2(status_output: bytes) -> dict[str, list[str]]:
+    """Parse `git status --porcelain=v2 -z` output into staged/unstaged/untracked paths.
+
+    Records are NUL-terminated. Changed entries start with '1' (ordinary),
+    '2' (rename/copy, followed by an extra record holding the original path)
+    or 'u' (unmerged), with the XY codes in bytes 2-3 where '.' means
+    unmodified. Untracked entries are '? path'. Paths are only decoded for
+    entries that end up in the result.
+    """
+    staged: list[str] = []
+    unstaged: list[str] = []
+    untracked: list[str] = []
+
+    records = iter(status_output.split(b'\0'))
+    for record in records:
+        kind = record[:1]
+        if kind == b'?':
+            untracked.append(os.fsdecode(record[2:]))
+            continue
+
+        path_field = _STATUS_V2_PATH_FIELD.get(kind)
+        if path_field is None:
+            continue  # Ignored entries, headers and the trailing empty record
+
+        filename = os.fsdecode(record.split(b' ', path_field)[path_field])
+        if kind == b'2':
+            next(records, None)  # Skip the original path of a rename/copy
+
+        if record[2:3] != b'.':
+            staged.append(filename)
+        if record[3:4] != b'.':
+            unstaged.append(filename)
+
+    return {
+        "staged": staged,
+        "unstaged": unstaged,
+        "untracked": untracked
+    }
+
 def get_worktree_git_status(worktree_name: str) -> dict[str, list[str]]:
     """Get git status for a worktree (staged, unstaged, untracked files).
 
@@ -299,71 +751,37 @@ def get_worktree_git_status(worktree_name: str) -> dict[str, list[str]]:
         return {"staged": [], "unstaged": [], "untracked": []}
 
     try:
-        # Get status using GitPython
-        repo = Repo(str(worktree_path))
-        status_output = repo.git.status('--short')
-
-        staged = []
-        unstaged = []
-        untracked = []
-
-        if status_output:
-            # Don't strip the whole output - that removes leading spaces from first line!
-            for line in status_output.split('\n'):
-                # Strip only trailing whitespace from each line
-                line = line.rstrip()
-                if not line:
-                    continue
-
-                # Parse git status --short format
-                # Format is: XY filename
-                # X = staged status, Y = unstaged status
-                status_codes = line[:2]
-                filename = line[3:] if len(line) > 3 else ""  # Git status has space after XY codes
-
-                x_code = status_codes[0]
-                y_code = status_codes[1]
-
-                # Check if file is untracked
-                if x_code == '?' and y_code == '?':
-                    untracked.append(filename)
-                else:
-                    # Check staged changes (first character)
-                    if x_code != ' ' and x_code != '?':
-                        staged.append(filename)
-
-                    # Check unstaged changes (second character)
-                    if y_code != ' ' and y_code != '?':
-                        unstaged.append(filename)
-
-        return {
-            "staged": staged,
-            "unstaged": unstaged,
-            "untracked": untracked
-        }
+        # Get NUL-delimited status as raw bytes so paths need no unquoting
+        status_output = _git(worktree_path, 'status', '--porcelain=v2', '-z')
+        return _parse_git_status_v2(status_output)
     except Exception:
         return {"staged": [], "unstaged": [], "untracked": []}
 
-def _format_relative_date(timestamp: int) -> str:
-    """Format a commit timestamp as a human-readable relative date string."""
-    commit_date = datetime.datetime.fromtimestamp(timestamp)
-    now = datetime.datetime.now()
-    delta = now - commit_date
-
-    if delta.days > 365:
-        return f"{delta.days // 365} year{'s' if delta.days // 365 > 1 else ''} ago"
-    elif delta.days > 30:
-        return f"{delta.days // 30} month{'s' if delta.days // 30 > 1 else ''} ago"
-    elif delta.days > 0:
-        return f"{delta.days} day{'s' if delta.days > 1 else ''} ago"
-    elif delta.seconds > 3600:
-        return f"{delta.seconds // 3600} hour{'s' if delta.seconds // 3600 > 1 else ''} ago"
-    elif delta.seconds > 60:
-        return f"{delta.seconds // 60} minute{'s' if delta.seconds // 60 > 1 else ''} ago"
+def _format_relative_date(timestamp: int, now: int) -> str:
+    """Format a commit timestamp as a human-readable relative date string.
+
+    Args:
+        timestamp: Commit time in seconds since the epoch
+        now: Current time in seconds since the epoch
+    """
+    days, seconds = divmod(now - timestamp, 86400)
+
+    if days > 365:
+        count, unit = days // 365, "year"
+    elif days > 30:
+        count, unit = days // 30, "month"
+    elif days > 0:
+        count, unit = days, "day"
+    elif seconds > 3600:
+        count, unit = seconds // 3600, "hour"
+    elif seconds > 60:
+        count, unit = seconds // 60, "minute"
     else:
         return "just now"
 
-def _get_sync_status(repo: Repo, current_branch: Any) -> tuple[str, int, int, str, Any]:
+    return f"{count} {unit}{'s' if count > 1 else ''} ago"
+
+def _get_sync_status(repo: Repo, worktree_path: Path, current_branch: Any) -> tuple[str, int, int, str, str | None]:
     """Determine sync status between local branch and its upstream/comparison branch.
 
     Returns:
@@ -376,36 +794,43 @@ def _get_sync_status(repo: Repo, current_branch: Any) -> tuple[str, int, int, st
         upstream = None
 
     # If no upstream, try to use origin/main as comparison
-    comparison_branch: Any = upstream
+    comparison_ref: str | None = upstream.name if upstream else None
+    comparison_path = upstream.path if upstream else 'refs/remotes/origin/main'
 
-    if not upstream:
+    if not comparison_ref:
         try:
             repo.commit('origin/main')
-            comparison_branch = 'origin/main'
+            comparison_ref = 'origin/main'
         except Exception:
-            comparison_branch = None
+            comparison_ref = None
 
     sync_status = "no-upstream"
     ahead_count = 0
     behind_count = 0
     comparison_branch_name = ""
 
-    if comparison_branch:
+    if comparison_ref:
         try:
-            branch_name = comparison_branch.name if hasattr(comparison_branch, 'name') else comparison_branch
-
             # Strip "origin/" prefix for display purposes
-            display_name = branch_name
+            display_name = comparison_ref
             if display_name.startswith('origin/'):
                 display_name = display_name[7:]
             comparison_branch_name = display_name
 
-            # Count commits ahead and behind
-            ahead_commits = list(repo.iter_commits(f'{branch_name}..{current_branch.name}'))
-            behind_commits = list(repo.iter_commits(f'{current_branch.name}..{branch_name}'))
-
-            ahead_count = len(ahead_commits)
-            behind_count = len(behind_commits)
+            # Branches whose tips are the same commit need no history walk;
+            # compare the tips read from the ref files before running rev-list
+            try:
+                tips_match = (SymbolicReference.dereference_recursive(repo, current_branch.path)
+                              == SymbolicReference.dereference_recursive(repo, comparison_path))
+            except ValueError:
+                tips_match = False
+
+            if not tips_match:
+                # Count commits ahead (left) and behind (right) in a single rev-list
+                counts = _git(worktree_path, 'rev-list', '--left-right', '--count', f'{current_branch.name}...{comparison_ref}')
+                ahead, behind = counts.split()
+                ahead_count = int(ahead)
+                behind_count = int(behind)
 
             if ahead_count == 0 and behind_count == 0:
                 sync_status = "up-to-date"
@@ -418,56 +843,64 @@ def _get_sync_status(repo: Repo, current_branch: Any) -> tuple[str, int, int, st
         except Exception:
             pass
 
-    return sync_status, ahead_count, behind_count, comparison_branch_name, comparison_branch
+    return sync_status, ahead_count, behind_count, comparison_branch_name, comparison_ref
 
-def _get_commit_list(repo: Repo, branch_name: str, comparison_branch: Any, max_count: int) -> list[dict[str, Any]]:
+def _get_commit_list(worktree_path: Path, branch_name: str, comparison_ref: str | None, max_count: int, ahead_count: int | None = None) -> list[dict[str, Any]]:
     """Get formatted commit list with pushed status.
 
+    Reads the commits with one NUL-delimited `git log -z` parsed as bytes
+    instead of building Commit objects, and marks a commit as pushed unless
+    `git rev-list` lists it as reachable from the branch but not from the
+    comparison ref. When the branch is already known to be zero commits
+    ahead, that rev-list is skipped.
+
     Args:
-        repo: GitPython Repo instance
+        worktree_path: Path to the worktree directory
         branch_name: Name of the current branch
-        comparison_branch: The upstream/comparison branch reference (or None)
+        comparison_ref: The upstream/comparison ref name (or None)
         max_count: Maximum number of commits to retrieve
+        ahead_count: Commits ahead of the comparison ref, if already counted
 
     Returns:
         List of commit dicts with 'hash', 'message', 'author', 'date', 'is_pushed'
     """
     commits: list[dict[str, Any]] = []
     try:
-        commit_list = list(repo.iter_commits(branch_name, max_count=max_count))
+        log_output = _git(worktree_path, 'log', '-z', f'--max-count={max_count}', '--format=%H%x1f%s%x1f%an%x1f%ct', branch_name)
 
-        # Get the set of pushed/existing commit hashes
-        pushed_commits: set[str] = set()
-        if comparison_branch:
+        # Without a comparison ref nothing counts as pushed
+        unpushed_commits: set[bytes] | None = None
+        if comparison_ref and ahead_count == 0:
+            unpushed_commits = set()
+        elif comparison_ref:
             try:
-                comp_name = comparison_branch.name if hasattr(comparison_branch, 'name') else comparison_branch
-                pushed_commit_list = list(repo.iter_commits(comp_name))
-                pushed_commits = {commit.hexsha for commit in pushed_commit_list}
+                unpushed_commits = set(_git(worktree_path, 'rev-list', f'{comparison_ref}..{branch_name}').split())
             except Exception:
                 pass
 
-        for commit in commit_list:
-            relative_date = _format_relative_date(commit.committed_date)
-
-            # Get commit message - ensure it's a string
-            message_str = str(commit.message).strip()
-            first_line = message_str.split('\n')[0] if '\n' in message_str else message_str
-
+        now = int(time.time())
+        # -z ends every record with a NUL, so the split leaves one empty tail
+        for record in log_output.split(b'\0')[:-1]:
+            hexsha, subject, author, committed_date = record.split(b'\x1f')
             commits.append({
-                "hash": commit.hexsha[:7],
-                "message": first_line,
-                "author": commit.author.name,
-                "date": relative_date,
-                "is_pushed": commit.hexsha in pushed_commits
+                "hash": hexsha[:7].decode(),
+                "message": subject.decode(errors='replace'),
+                "author": author.decode(errors='replace'),
+                "date": _format_relative_date(int(committed_date), now),
+                "is_pushed": unpushed_commits is not None and hexsha not in unpushed_commits
             })
     except Exception:
         pass
 
     return commits
 
-def get_worktree_git_log(worktree_name: str) -> dict[str, Any]:
+def get_worktree_git_log(worktree_name: str, max_commits: int = GIT_LOG_MAX_COMMITS) -> dict[str, Any]:
     """Get git log information for a worktree with push/unpush status.
 
+    Args:
+        worktree_name: The worktree to read
+        max_commits: Maximum number of recent commits to list
+
     Returns:
         Dict with:
         - 'sync_status': str - 'up-to-date', 'ahead', 'behind', 'diverged', 'no-upstream'
@@ -486,15 +919,17 @@ def get_worktree_git_log(worktree_name: str) -> dict[str, Any]:
         return _EMPTY_GIT_LOG.copy()
 
     try:
-        repo = Repo(str(worktree_path))
+        repo = _repo_for(str(worktree_path))
 
         if repo.head.is_detached:
             return _EMPTY_GIT_LOG.copy()
 
         current_branch = repo.active_branch
 
-        sync_status, ahead_count, behind_count, comparison_branch_name, comparison_ref = _get_sync_status(repo, current_branch)
-        commits = _get_commit_list(repo, current_branch.name, comparison_ref, 20)
+        sync_status, ahead_count, behind_count, comparison_branch_name, comparison_ref = _get_sync_status(repo, worktree_path, current_branch)
+        # Counts are only valid when the sync status could be determined
+        known_ahead = ahead_count if sync_status != "no-upstream" else None
+        commits = _get_commit_list(worktree_path, current_branch.name, comparison_ref, max_commits, known_ahead)
 
         return {
             "sync_status": sync_status,
@@ -507,51 +942,129 @@ def get_worktree_git_log(worktree_name: str) -> dict[str, Any]:
     except Exception:
         return _EMPTY_GIT_LOG.copy()
 
-def _capture_window_data(window: Any) -> dict[str, str | bool]:
-    """Capture pane content data for a single tmux window.
+def _list_active_panes(session_names: set[str] | None) -> dict[str, list[dict[str, str | bool]]]:
+    """List the active pane of every tmux window with one `tmux list-panes` call.
 
-    Returns a dict with 'window_name', 'window_index', 'content', and 'is_active' keys.
+    A single requested session is listed on its own (`-s -t =name`) so tmux
+    doesn't format every pane on the server; otherwise all panes are listed.
+
+    Returns:
+        Dict mapping session name to window dicts with 'window_name',
+        'window_index', 'is_active' and 'pane_id' keys, in tmux order
     """
-    window_name: str = str(window.window_name or f"window-{window.window_index}")
-    window_index: str = str(window.window_index or "0")
-    is_active: bool = window.window_active == '1'
+    if session_names is not None and len(session_names) == 1:
+        scope = ['-s', '-t', f"={next(iter(session_names))}"]
+    else:
+        scope = ['-a']
+    result = subprocess.run(
+        ['tmux', 'list-panes', *scope, '-F', _TMUX_PANE_FORMAT],
+        capture_output=True,
+        text=True,
+        timeout=2
+    )
+    if result.returncode != 0:
+        return {}  # No tmux server running, or the session doesn't exist
+
+    sessions: dict[str, list[dict[str, str | bool]]] = {}
+    windows: dict[tuple[str, str], dict[str, str | bool]] = {}
+    for line in result.stdout.splitlines():
+        session_name, window_index, window_name, window_active, pane_active, pane_id = line.split('\t')
+        if session_names is not None and session_name not in session_names:
+            continue
+
+        key = (session_name, window_index)
+        window = windows.get(key)
+        if window is None:
+            # First pane of the window stands in until the active pane is seen
+            window = {
+                "window_name": window_name or f"window-{window_index}",
+                "window_index": window_index or "0",
+                "is_active": window_active == '1',
+                "pane_id": pane_id,
+            }
+            windows[key] = window
+            sessions.setdefault(session_name, []).append(window)
+        elif pane_active == '1':
+            window["pane_id"] = pane_id
 
-    if not window.panes:
-        return {
-            "window_name": window_name,
-            "window_index": window_index,
-            "content": "No panes in window",
-            "is_active": is_active
-        }
+    return sessions
+
+def capture_all_active_panes(session_names: set[str] | None = None) -> dict[str, list[dict[str, str | bool]]]:
+    """Capture the active pane of every window across tmux sessions in two tmux calls.
+
+    One `tmux list-panes -a` enumerates the panes, then a single tmux
+    invocation chains a `capture-pane` per window (separated by a marker
+    line), instead of one capture subprocess per pane.
 
-    # Find the active pane
-    active_pane = None
-    for pane in window.panes:
-        if pane.pane_active == '1':
-            active_pane = pane
-            break
+    Args:
+        session_names: Only capture these sessions (all sessions if None)
+
+    Returns:
+        Dict mapping session name to a list of dicts with 'window_name',
+        'window_index', 'content', and 'is_active' keys
+    """
+    sessions = _list_active_panes(session_names)
+    windows = [window for session_windows in sessions.values() for window in session_windows]
+    if not windows:
+        return sessions
+
+    command: list[str] = ['tmux']
+    for window in windows:
+        command += ['display-message', '-p', _TMUX_CAPTURE_MARKER, ';',
+                    'capture-pane', '-p', '-t', str(window.pop("pane_id")), ';']
+    result = subprocess.run(command[:-1], capture_output=True, text=True, timeout=5)
+
+    # Output is "<marker>\n<pane content>" per window; a pane closing mid-capture stops the chain
+    contents = result.stdout.split(f"{_TMUX_CAPTURE_MARKER}\n")[1:]
+    for i, window in enumerate(windows):
+        window["content"] = contents[i].rstrip('\n') if i < len(contents) else "Error capturing pane"
+
+    return sessions
+
+def _get_cached_pane_preview(worktree_name: str) -> list[dict[str, str | bool]] | str | None:
+    """Return a live cached pane preview for a worktree, or None on a miss."""
+    entry = _tmux_pane_cache.get(worktree_name)
+    if entry is None:
+        return None
+
+    expires_at, data = entry
+    if time.monotonic() >= expires_at:
+        del _tmux_pane_cache[worktree_name]
+        return None
+
+    _tmux_pane_cache.move_to_end(worktree_name)
+    return data
 
-    # If no active pane found, use the first pane
-    if active_pane is None:
-        active_pane = window.panes[0]
+def _cache_pane_preview(worktree_name: str, data: list[dict[str, str | bool]] | str) -> None:
+    """Store a pane preview, evicting the least recently used entry when full.
 
-    # Capture the pane content (visible portion only for performance)
+    Window data is kept for TMUX_PANE_CACHE_TTL. Status and error messages
+    expire after TMUX_PANE_ERROR_CACHE_TTL so a new or restarted session
+    shows up quickly.
+    """
+    ttl = TMUX_PANE_CACHE_TTL if isinstance(data, list) else TMUX_PANE_ERROR_CACHE_TTL
+    _tmux_pane_cache[worktree_name] = (time.monotonic() + ttl, data)
+    _tmux_pane_cache.move_to_end(worktree_name)
+
+    while len(_tmux_pane_cache) > TMUX_PANE_CACHE_MAXSIZE:
+        _tmux_pane_cache.popitem(last=False)
+
+def _fetch_tmux_pane_preview(worktree_name: str) -> list[dict[str, str | bool]] | str:
+    """Capture pane content for all windows in a worktree's session, bypassing the cache."""
     try:
-        captured = active_pane.capture_pane()
+        # Create session name from worktree name (replace dots with dashes)
+        session_name = get_session_name(worktree_name)
 
-        if isinstance(captured, list):
-            content = '\n'.join(captured)
-        else:
-            content = str(captured) if captured else "Empty pane"
-    except Exception:
-        content = "Error capturing pane"
+        windows_data = capture_all_active_panes({session_name}).get(session_name)
+        if not windows_data:
+            return "No active tmux session"
 
-    return {
-        "window_name": window_name,
-        "window_index": window_index,
-        "content": content,
-        "is_active": is_active
-    }
+        return windows_data
+
+    except (OSError, subprocess.SubprocessError):
+        return "Tmux not available"
+    except Exception as e:
+        return f"Error capturing pane: {str(e)}"
 
 def get_tmux_pane_preview(worktree_name: str) -> list[dict[str, str | bool]] | str:
     """Get tmux pane preview content for all windows in a worktree's active session.
@@ -567,58 +1080,32 @@ def get_tmux_pane_preview(worktree_name: str) -> list[dict[str, str | bool]] | s
         return ""
 
     # Check cache first
-    current_time = time.time()
-    if worktree_name in _tmux_pane_cache:
-        cached_timestamp, cached_data = _tmux_pane_cache[worktree_name]
-        if current_time - cached_timestamp < TMUX_PANE_CACHE_TTL:
-            return cached_data
-
-    try:
-        # Get tmux server
-        server = get_tmux_server()
-        if server is None:
-            result: list[dict[str, str | bool]] | str = "Tmux not available"
-            _tmux_pane_cache[worktree_name] = (time.time(), result)
-            return result
-
-        # Create session name from worktree name (replace dots with dashes)
-        session_name = get_session_name(worktree_name)
-
-        # Check if session exists
-        if not session_exists(server, session_name):
-            result = "No active tmux session"
-            _tmux_pane_cache[worktree_name] = (time.time(), result)
-            return result
-
-        # Get the session
-        sessions = server.sessions.filter(session_name=session_name)
-        if not sessions:
-            result = "No active tmux session"
-            _tmux_pane_cache[worktree_name] = (time.time(), result)
-            return result
-
-        session = sessions[0]
-
-        # Get all windows in the session
-        if not session.windows:
-            result = "No windows in session"
-            _tmux_pane_cache[worktree_name] = (time.time(), result)
-            return result
+    cached_data = _get_cached_pane_preview(worktree_name)
+    if cached_data is not None:
+        return cached_data
 
-        windows_data = [_capture_window_data(window) for window in session.windows]
+    result = _fetch_tmux_pane_preview(worktree_name)
+    _cache_pane_preview(worktree_name, result)
+    return result
 
-        result = windows_data if windows_data else "No windows in session"
+def get_worktree_details(worktree_name: str) -> tuple[dict[str, list[str]], dict[str, Any], list[dict[str, str | bool]] | str]:
+    """Get git status, git log and tmux pane preview for a worktree concurrently.
 
-        # Cache the result
-        _tmux_pane_cache[worktree_name] = (time.time(), result)
+    The three lookups run independent git and tmux subprocesses, so they are
+    overlapped on the shared I/O pool and cost the slowest one instead of
+    their sum.
 
-        return result
+    Args:
+        worktree_name: The name of the worktree
 
-    except Exception as e:
-        error_msg = f"Error capturing pane: {str(e)}"
-        # Cache error messages too (to avoid repeated failures)
-        _tmux_pane_cache[worktree_name] = (time.time(), error_msg)
-        return error_msg
+    Returns:
+        Tuple of (get_worktree_git_status, get_worktree_git_log,
+        get_tmux_pane_preview) results
+    """
+    status_future = _IO_POOL.submit(get_worktree_git_status, worktree_name)
+    log_future = _IO_POOL.submit(get_worktree_git_log, worktree_name)
+    preview_future = _IO_POOL.submit(get_tmux_pane_preview, worktree_name)
+    return status_future.result(), log_future.result(), preview_future.result()
 
 def create_worktree_with_branch(name: str, prefix: str) -> tuple[bool, str]:
     """Create a git worktree with the specified name and branch prefix.
@@ -642,7 +1129,7 @@ def create_worktree_with_branch(name: str, prefix: str) -> tuple[bool, str]:
 
     try:
         # Open the bare repository
-        repo = Repo(str(bare_repo_path))
+        repo = _repo_for(str(bare_repo_path))
 
         # Check if remote branch exists
         remote_branch_exists = False
@@ -666,6 +1153,9 @@ def create_worktree_with_branch(name: str, prefix: str) -> tuple[bool, str]:
 
         # Create the worktree
         repo.git.worktree('add', str(worktree_dir), branch_name)
+        invalidate_repo_cache()
+        invalidate_git_info_cache()
+        invalidate_file_cache()
 
         # Run .grove/.setup script if it exists
         setup_script = bare_parent / ".grove" / ".setup"
@@ -722,21 +1212,85 @@ def _stop_docker_containers(worktree_dir: Path) -> str | None:
 
     return None
 
-def _remove_worktree_directory(repo: Repo, worktree_dir: Path, worktree_dir_name: str) -> tuple[bool, str]:
+def list_registered_worktrees(repo: Repo) -> set[str]:
+    """Get the paths of all worktrees registered with a repository.
+
+    Parses the NUL-delimited output of `git worktree list --porcelain -z`,
+    where each record field is a "key value" pair such as "worktree /path".
+
+    Args:
+        repo: GitPython Repo instance for the bare repository
+
+    Returns:
+        Set of absolute worktree paths as reported by git
+    """
+    output = repo.git.worktree('list', '--porcelain', '-z', strip_newline_in_stdout=False)
+    return {field[9:] for field in output.split('\0') if field.startswith('worktree ')}
+
+def get_registered_worktrees() -> set[str] | None:
+    """Get the registered worktree paths of the active repository.
+
+    Lets callers removing several worktrees list them once and pass the
+    result to remove_worktree_with_branch.
+
+    Returns:
+        Set of absolute worktree paths, or None if they couldn't be listed
+    """
+    try:
+        return list_registered_worktrees(_repo_for(str(get_repo_path() / ".bare")))
+    except Exception:
+        return None
+
+def _fast_rmtree(path: Path) -> None:
+    """Delete a directory tree using os.scandir entries.
+
+    DirEntry.is_dir(follow_symlinks=False) is answered from the directory
+    listing, so files are unlinked without a separate stat each. Symlinks
+    are removed, never followed. Falls back to shutil.rmtree if anything
+    fails part-way.
+    """
+    if os.path.islink(path):
+        shutil.rmtree(path)  # Refuses symlinks with the usual error
+        return
+
+    try:
+        pending = [str(path)]
+        visited: list[str] = []
+        while pending:
+            directory = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            visited.append(directory)
+
+        # Children were visited after their parents, so remove in reverse
+        for directory in reversed(visited):
+            os.rmdir(directory)
+    except OSError:
+        shutil.rmtree(path)
+
+def _remove_worktree_directory(repo: Repo, worktree_dir: Path,
+                              registered_worktrees: set[str] | None = None) -> tuple[bool, str]:
     """Remove a worktree's git registration and directory.
 
     Args:
         repo: GitPython Repo instance for the bare repository
         worktree_dir: Path to the worktree directory
-        worktree_dir_name: Name of the worktree directory
+        registered_worktrees: Prefetched registered worktree paths (listed from git if None)
 
     Returns:
         Tuple of (success: bool, error_message: str)
     """
-    # Check if worktree is registered
+    # Check if worktree is registered (exact path match, not substring).
+    # git may report the symlink-resolved path, so fall back to that form.
     try:
-        worktrees = repo.git.worktree('list').strip().split('\n')
-        worktree_registered = any(worktree_dir_name in wt for wt in worktrees)
+        if registered_worktrees is None:
+            registered_worktrees = list_registered_worktrees(repo)
+        worktree_registered = (str(worktree_dir) in registered_worktrees
+                               or os.path.realpath(worktree_dir) in registered_worktrees)
     except GitCommandError:
         worktree_registered = False
 
@@ -751,7 +1305,7 @@ def _remove_worktree_directory(repo: Repo, worktree_dir: Path, worktree_dir_name
     # Remove the directory if it still exists
     if worktree_dir.exists():
         try:
-            shutil.rmtree(worktree_dir)
+            _fast_rmtree(worktree_dir)
         except (OSError, PermissionError) as e:
             return False, f"Failed to remove directory: {str(e)}"
 
@@ -763,11 +1317,14 @@ def _remove_worktree_directory(repo: Repo, worktree_dir: Path, worktree_dir_name
 
     return True, ""
 
-def remove_worktree_with_branch(worktree_dir_name: str) -> tuple[bool, str]:
+def remove_worktree_with_branch(worktree_dir_name: str,
+                                registered_worktrees: set[str] | None = None) -> tuple[bool, str]:
     """Remove a git worktree and its associated branch.
 
     Args:
         worktree_dir_name: The worktree directory name
+        registered_worktrees: Prefetched result of get_registered_worktrees() to
+            reuse across several removals (listed from git if None)
 
     Returns:
         Tuple of (success: bool, error_message: str)
@@ -782,24 +1339,39 @@ def remove_worktree_with_branch(worktree_dir_name: str) -> tuple[bool, str]:
     worktree_dir = bare_parent / worktree_dir_name
 
     try:
-        # Stop Docker containers if stop script exists
-        docker_stop_warning = _stop_docker_containers(worktree_dir)
-
-        # Open the bare repository
-        repo = Repo(str(bare_repo_path))
+        # Stop Docker containers (if a stop script exists) in the background;
+        # it can take up to a minute and doesn't touch the git state read below
+        docker_future = _IO_POOL.submit(_stop_docker_containers, worktree_dir)
 
-        # Get the branch name from the worktree itself (instead of reconstructing it)
-        branch_name = None
-        if worktree_dir.exists():
-            try:
-                worktree_repo = Repo(str(worktree_dir))
-                if not worktree_repo.head.is_detached:
-                    branch_name = worktree_repo.active_branch.name
-            except Exception:
-                pass
+        try:
+            # Open the bare repository
+            repo = _repo_for(str(bare_repo_path))
+
+            # Get the branch name from the worktree itself (instead of reconstructing it)
+            branch_name = None
+            if worktree_dir.exists():
+                try:
+                    worktree_repo = _repo_for(str(worktree_dir))
+                    if not worktree_repo.head.is_detached:
+                        branch_name = worktree_repo.active_branch.name
+                except Exception:
+                    pass
+
+            # List registered worktrees while Docker is still stopping
+            if registered_worktrees is None:
+                try:
+                    registered_worktrees = list_registered_worktrees(repo)
+                except GitCommandError:
+                    registered_worktrees = set()
+        finally:
+            # Containers must be stopped before their directory is removed
+            docker_stop_warning = docker_future.result()
 
         # Remove worktree registration and directory
-        success, error_msg = _remove_worktree_directory(repo, worktree_dir, worktree_dir_name)
+        success, error_msg = _remove_worktree_directory(repo, worktree_dir, registered_worktrees)
+        invalidate_repo_cache()
+        invalidate_git_info_cache()
+        invalidate_file_cache()
         if not success:
             return False, error_msg
 
@@ -1,6 +1,6 @@
 """Textual widgets for Grove application."""
 
-from typing import Any
+from typing import Any, Callable
 from textual.app import ComposeResult
 from textual.widgets import ListView, ListItem, Label, Markdown, Static
 from textual.widget import Widget
@@ -9,14 +9,13 @@ from textual.reactive import reactive
 from textual.containers import VerticalScroll, Horizontal
 from rich.text import Text
 from rich.console import RenderableType
+from rich.style import Style
 
 from .config import ConfigError
 from .utils import (
-    get_worktree_directories,
+    scan_worktrees,
     get_active_tmux_sessions,
-    get_worktree_pr_status,
     get_worktree_metadata,
-    get_worktree_git_info,
     get_worktree_git_status,
     get_tmux_pane_preview,
     get_worktree_git_log,
@@ -30,6 +29,14 @@ class Sidebar(ListView):
         Binding("k", "cursor_up", "Move up", show=False),
     ]
 
+    # Row icons for worktrees with and without an active tmux session
+    _ICON_ACTIVE = "● "
+    _ICON_IDLE = "○ "
+
+    # (name, has_session, has_pr) for each worktree row currently shown, or
+    # None when the list shows something else (loading or an error)
+    _shown_rows: list[tuple[str, bool, bool]] | None = None
+
     def compose(self) -> ComposeResult:
         """Compose initial empty structure - data loaded on mount."""
         yield ListItem(Label("Loading..."))
@@ -38,26 +45,54 @@ class Sidebar(ListView):
         """Load worktree data when widget is mounted."""
         self.refresh_directories()
 
+    def _row_text(self, directory: str, has_session: bool, has_pr: bool) -> Text:
+        """Build a row label as Rich Text so it skips markup parsing."""
+        row = Text(self._ICON_ACTIVE if has_session else self._ICON_IDLE)
+        if has_pr:
+            row.append("PR", style="bold")
+            row.append(" ")
+        row.append(directory)
+        return row
+
     def refresh_directories(self) -> None:
-        """Refresh the sidebar with current worktree directories."""
+        """Refresh the sidebar with current worktree directories.
+
+        Rows are only touched when their state changed: an identical refresh
+        does nothing, and session or PR changes relabel the affected rows in
+        place. The list is rebuilt only when worktrees are added or removed.
+        """
         try:
-            directories = get_worktree_directories()
+            worktrees = scan_worktrees()
             sessions = get_active_tmux_sessions()
-            pr_worktrees = get_worktree_pr_status()
-
-            self.clear()
-
-            if directories:
-                for directory in directories:
-                    icon = "●" if get_session_name(directory) in sessions else "○"
-                    pr_indicator = " [bold]PR[/bold]" if directory in pr_worktrees else ""
-                    self.append(ListItem(Label(f"{icon}{pr_indicator} {directory}")))
-            else:
-                self.append(ListItem(Label("No directories found")))
         except ConfigError as e:
+            self._shown_rows = None
             self.clear()
             self.append(ListItem(Label(f"[bold red]Error:[/bold red] {str(e)}")))
             self.append(ListItem(Label("[dim]Check your Grove configuration[/dim]")))
+            return
+
+        rows = [
+            (worktree["name"], get_session_name(worktree["name"]) in sessions, worktree["has_pr"])
+            for worktree in worktrees
+        ]
+        shown_rows = self._shown_rows
+        if rows == shown_rows:
+            return
+
+        if shown_rows and [row[0] for row in rows] == [row[0] for row in shown_rows]:
+            # Same worktrees in the same order; relabel only the rows that changed
+            for item, row, shown_row in zip(self.query_children(ListItem), rows, shown_rows):
+                if row != shown_row:
+                    item.query_one(Label).update(self._row_text(*row))
+        else:
+            self.clear()
+            if rows:
+                # The worktree name is kept on the item for selection handling
+                self.extend(ListItem(Label(self._row_text(*row)), name=row[0]) for row in rows)
+            else:
+                self.append(ListItem(Label("No directories found")))
+
+        self._shown_rows = rows
 
 
 class ScrollableContainer(VerticalScroll):
@@ -91,49 +126,90 @@ class GitStatusDisplay(Widget):
         ("untracked", "Untracked Files", "? ", "yellow"),
     ]
 
-    def update_content(self, worktree_name: str) -> None:
-        """Update the display with git status for the given worktree."""
+    # (bold, plain) Style per section color, parsed once rather than on every append
+    _SECTION_STYLES: dict[str, tuple[Style, Style]] = {
+        color: (Style(bold=True, color=color), Style(color=color)) for _, _, _, color in _SECTIONS
+    }
+
+    # Status of the shown worktree, fetched once per update so repaints and
+    # layout passes don't re-run git, and the Text built from it on first render
+    _status: dict[str, list[str]] | None = None
+    _rendered: Text | None = None
+
+    def update_content(self, worktree_name: str, status: dict[str, list[str]] | None = None) -> None:
+        """Update the display with git status for the given worktree.
+
+        Args:
+            worktree_name: The worktree to show
+            status: Prefetched get_worktree_git_status() result (fetched here if None)
+        """
+        if status is None and worktree_name:
+            status = get_worktree_git_status(worktree_name)
+
+        # Nothing to repaint or re-lay out when the same status is shown again
+        if worktree_name == self.worktree_name and status == self._status:
+            return
+
+        self._status = status
+        self._rendered = None
         self.worktree_name = worktree_name
         self.refresh(layout=True)
 
-    def _render_file_section(self, files: list[str], header: str, icon: str, color: str) -> list[Text]:
-        """Render a section of files (staged, unstaged, or untracked) with consistent styling."""
-        lines: list[Text] = []
-        lines.append(Text(header, style=f"bold {color}"))
+    def _render_file_section(self, out: Text, files: list[str], header: str, icon: str, color: str) -> None:
+        """Append a section of files (staged, unstaged, or untracked) with consistent styling to out."""
+        bold_style, file_style = self._SECTION_STYLES[color]
+        out.append(header, style=bold_style)
         for file in files:
-            file_line = Text()
-            file_line.append(icon, style=f"bold {color}")
-            file_line.append(file, style=color)
-            lines.append(file_line)
-        return lines
+            out.append("\n")
+            out.append(icon, style=bold_style)
+            out.append(file, style=file_style)
 
     def render(self) -> RenderableType:
-        """Render git status with Rich Text styling."""
-        if not self.worktree_name:
+        """Render git status with Rich Text styling, reusing the Text until the next update."""
+        if self._rendered is None:
+            self._rendered = self._build_status_text()
+        return self._rendered
+
+    def _build_status_text(self) -> Text:
+        """Build the git status Text for the current status."""
+        status = self._status
+        if not self.worktree_name or status is None:
             return Text("Select a worktree to view git status", style="dim italic")
 
-        status = get_worktree_git_status(self.worktree_name)
-
         if not status["staged"] and not status["unstaged"] and not status["untracked"]:
             return Text("Working tree clean", style="dim italic")
 
-        lines: list[Text] = []
+        # Append every section into one Text instead of joining per-line Texts
+        out = Text()
         for key, header, icon, color in self._SECTIONS:
             if status[key]:
-                if lines:
-                    lines.append(Text())  # Separator between sections
-                lines.extend(self._render_file_section(status[key], header, icon, color))
+                if out:
+                    out.append("\n\n")  # Blank line between sections
+                self._render_file_section(out, status[key], header, icon, color)
+
+        return out
 
-        return Text("\n").join(lines)
 
+# Sync status display configuration: (icon, label(ahead, behind), color)
+_SYNC_STATUS_CONFIG: dict[str, tuple[str, Callable[[int, int], str], str]] = {
+    "up-to-date": ("✓ ", lambda ahead, behind: "Up to date", "green"),
+    "ahead": ("↑ ", lambda ahead, behind: f"Ahead {ahead} commit{'s' if ahead > 1 else ''}", "yellow"),
+    "behind": ("↓ ", lambda ahead, behind: f"Behind {behind} commit{'s' if behind > 1 else ''}", "red"),
+    "diverged": ("⚠ ", lambda ahead, behind: f"Diverged (↑{ahead} ↓{behind})", "magenta"),
+}
+
+# (icon, label, comparison branch) Style per sync status, parsed once at import
+_SYNC_STATUS_STYLES: dict[str, tuple[Style, Style, Style]] = {
+    status: (Style(bold=True, color=color), Style(color=color), Style(dim=True, color=color))
+    for status, (_, _, color) in _SYNC_STATUS_CONFIG.items()
+}
 
-# Sync status display configuration: (icon, label_template, color)
-_SYNC_STATUS_CONFIG: dict[str, tuple[str, str, str]] = {
-    "up-to-date": ("✓ ", "Up to date", "green"),
-    "ahead": ("↑ ", "Ahead {ahead} commit{s}", "yellow"),
-    "behind": ("↓ ", "Behind {behind} commit{s}", "red"),
-    "diverged": ("⚠ ", "Diverged (↑{ahead} ↓{behind})", "magenta"),
+# Commit entry styles keyed by is_pushed: (hash, message, author, date), parsed once at import
+_COMMIT_STYLES: dict[bool, tuple[Style, Style, Style, Style]] = {
+    False: (Style.parse("bold yellow"), Style.parse("bold white"), Style.parse("cyan"), Style.parse("green")),
+    True: (Style.parse("dim cyan"), Style.parse("dim white"), Style.parse("dim"), Style.parse("dim")),
 }
+_SEPARATOR_STYLE = Style.parse("dim")
 
 
 class GitLogDisplay(Widget):
@@ -141,176 +217,138 @@ class GitLogDisplay(Widget):
 
     worktree_name: reactive[str] = reactive("")
 
-    def update_content(self, worktree_name: str) -> None:
-        """Update the display with git log for the given worktree."""
+    # Log of the shown worktree, fetched once per update so repaints and
+    # layout passes don't re-run git, and the Text built from it on first render
+    _log_data: dict[str, Any] | None = None
+    _rendered: Text | None = None
+
+    def update_content(self, worktree_name: str, log_data: dict[str, Any] | None = None) -> None:
+        """Update the display with git log for the given worktree.
+
+        Args:
+            worktree_name: The worktree to show
+            log_data: Prefetched get_worktree_git_log() result (fetched here if None)
+        """
+        if log_data is None and worktree_name:
+            log_data = get_worktree_git_log(worktree_name)
+
+        # Nothing to repaint or re-lay out when the same log is shown again
+        if worktree_name == self.worktree_name and log_data == self._log_data:
+            return
+
+        self._log_data = log_data
+        self._rendered = None
         self.worktree_name = worktree_name
         self.refresh(layout=True)
 
-    def _render_sync_status(self, log_data: dict[str, Any]) -> Text:
-        """Render the sync status line from log data."""
+    def _render_sync_status(self, out: Text, log_data: dict[str, Any]) -> None:
+        """Append the sync status line from log data to out."""
         sync_status = log_data["sync_status"]
         comparison_branch = log_data.get("comparison_branch", "")
 
         if sync_status == "no-upstream":
-            line = Text()
-            line.append("• ", style="dim")
-            line.append("No comparison branch available", style="dim italic")
-            return line
+            out.append("• ", style="dim")
+            out.append("No comparison branch available", style="dim italic")
+            return
 
         config = _SYNC_STATUS_CONFIG.get(sync_status)
         if not config:
-            return Text()
-
-        icon, label_template, color = config
-        ahead = log_data["ahead_count"]
-        behind = log_data["behind_count"]
-
-        label = label_template.format(
-            ahead=ahead,
-            behind=behind,
-            s="s" if (ahead > 1 if "ahead" in label_template.lower() else behind > 1) else "",
-        )
+            return
 
-        line = Text()
-        line.append(icon, style=f"bold {color}")
-        line.append(label, style=color)
+        icon, label, _ = config
+        icon_style, label_style, branch_style = _SYNC_STATUS_STYLES[sync_status]
+        out.append(icon, style=icon_style)
+        out.append(label(log_data["ahead_count"], log_data["behind_count"]), style=label_style)
         if comparison_branch:
-            line.append(f" ({comparison_branch})", style=f"dim {color}")
-        return line
-
-    def _render_commit(self, commit: dict[str, Any]) -> list[Text]:
-        """Render a single commit entry (hash + message line, then author + date line)."""
-        if not commit["is_pushed"]:
-            hash_style, message_style = "bold yellow", "bold white"
-            author_style, date_style = "cyan", "green"
-        else:
-            hash_style, message_style = "dim cyan", "dim white"
-            author_style, date_style = "dim", "dim"
+            out.append(f" ({comparison_branch})", style=branch_style)
 
-        commit_line = Text()
-        commit_line.append(f"{commit['hash']} ", style=hash_style)
-        commit_line.append(f"{commit['message']}", style=message_style)
+    def _render_commit(self, out: Text, commit: dict[str, Any]) -> None:
+        """Append a single commit entry (hash + message line, then author + date line) to out."""
+        hash_style, message_style, author_style, date_style = _COMMIT_STYLES[bool(commit["is_pushed"])]
 
-        info_line = Text()
-        info_line.append("  ", style="")
-        info_line.append(f"{commit['author']}", style=author_style)
-        info_line.append(" • ", style="dim")
-        info_line.append(f"{commit['date']}", style=date_style)
+        out.append("\n")
+        out.append(commit["hash"] + " ", style=hash_style)
+        out.append(commit["message"], style=message_style)
 
-        return [commit_line, info_line]
+        out.append("\n  ")
+        out.append(commit["author"], style=author_style)
+        out.append(" • ", style=_SEPARATOR_STYLE)
+        out.append(commit["date"], style=date_style)
 
     def render(self) -> RenderableType:
-        """Render git log with Rich Text styling."""
-        if not self.worktree_name:
+        """Render git log with Rich Text styling, reusing the Text until the next update."""
+        if self._rendered is None:
+            self._rendered = self._build_log_text()
+        return self._rendered
+
+    def _build_log_text(self) -> Text:
+        """Build the git log Text for the current log data."""
+        log_data = self._log_data
+        if not self.worktree_name or log_data is None:
             return Text("Select a worktree to view git log", style="dim italic")
-
-        log_data = get_worktree_git_log(self.worktree_name)
-        lines: list[Text] = [self._render_sync_status(log_data), Text()]
+        # Append every line into one Text instead of joining per-line Texts
+        out = Text()
+        self._render_sync_status(out, log_data)
+        out.append("\n")
 
         commits = log_data["commits"]
         if not commits:
-            lines.append(Text("No commits", style="dim italic"))
+            out.append("\n")
+            out.append("No commits", style="dim italic")
         else:
             for commit in commits:
-                lines.extend(self._render_commit(commit))
-
-        return Text("\n").join(lines)
-
-
-class MetadataTopDisplay(Markdown):
-    """Widget to display description and PR info metadata."""
-
-    @staticmethod
-    def _format_section(heading: str, content: str | None, fallback: str) -> list[str]:
-        """Format a markdown section with heading and content or fallback text."""
-        return [f"## {heading}", content if content else f"*{fallback}*", ""]
-
-    def update_content(self, worktree_name: str) -> None:
-        """Update the display with metadata for the given worktree."""
-        if not worktree_name:
-            self.update("*Select a worktree to view metadata*")
-            return
+                self._render_commit(out, commit)
 
-        metadata = get_worktree_metadata(worktree_name)
+        return out
 
-        content_parts: list[str] = []
-        content_parts.extend(self._format_section(
-            "Description", metadata.get("description"), "No description available"
-        ))
-        content_parts.extend(self._format_section(
-            "Pull Request Info", metadata.get("pr"), "No PR information available"
-        ))
 
-        self.update("\n".join(content_parts))
-
-
-class MetadataBottomDisplay(Markdown):
-    """Widget to display notes and git information."""
-
-    @staticmethod
-    def _format_section(heading: str, content: str | None, fallback: str) -> list[str]:
-        """Format a markdown section with heading and content or fallback text."""
-        return [f"## {heading}", content if content else f"*{fallback}*", ""]
-
-    def update_content(self, worktree_name: str) -> None:
-        """Update the display with metadata for the given worktree."""
-        if not worktree_name:
-            self.update("*Select a worktree to view metadata*")
-            return
-
-        metadata = get_worktree_metadata(worktree_name)
-        git_info = get_worktree_git_info(worktree_name)
+class WindowPreview(Widget):
+    """Widget to display a single tmux window's title and pane content.
 
-        content_parts: list[str] = []
-        content_parts.extend(self._format_section(
-            "Notes", metadata.get("notes"), "No notes available"
-        ))
-        content_parts.extend([
-            "## Git Information",
-            "",
-            f"**Last Commit:** {git_info['commit_message']}",
-            "",
-            f"**Date:** {git_info['commit_date']}",
-            "",
-            f"**Committer:** {git_info['committer']}",
-        ])
+    The title bar and content are painted by render() rather than mounted as
+    child widgets, so each window costs one widget in the preview.
+    """
 
-        self.update("\n".join(content_parts))
+    COMPONENT_CLASSES = {"window-preview--title"}
 
-
-class WindowPreview(Widget):
-    """Widget to display a single tmux window's pane content."""
+    # Text from the last render with the (width, title style) it was built for;
+    # window_data is fixed per widget, so repaints at the same size reuse it
+    _rendered: tuple[tuple[int, Style], Text] | None = None
 
     def __init__(self, window_data: dict[str, str | bool], **kwargs: Any) -> None:
         """Initialize with window data."""
         super().__init__(**kwargs)
         self.window_data = window_data
 
-    def compose(self) -> ComposeResult:
-        """Compose the window preview with title and content."""
+    def render(self) -> RenderableType:
+        """Render the title bar above the window content, reusing the Text while the size and style hold."""
+        title_style = self.get_component_rich_style("window-preview--title")
+        key = (self.size.width, title_style)
+        if self._rendered is None or self._rendered[0] != key:
+            self._rendered = (key, self._build_text(*key))
+        return self._rendered[1]
+
+    def _build_text(self, width: int, title_style: Style) -> Text:
+        """Build the title bar and content Text for the given width."""
         window_index = self.window_data.get("window_index", "?")
         window_name = self.window_data.get("window_name", "unknown")
         is_active = self.window_data.get("is_active", False)
 
         active_indicator = "*" if is_active else " "
-        title = f"{active_indicator}{window_index}: {window_name}"
-
-        yield Static(title, classes="window-title")
-        content = str(self.window_data.get("content", ""))
-        yield WindowContent(content, classes="window-content")
 
+        # Pad the title to a full-width single-line bar with one cell either side
+        title = Text(f" {active_indicator}{window_index}: {window_name}")
+        title.truncate(max(width - 1, 0))
+        title.pad_right(width - title.cell_len)
+        title.stylize(title_style)
 
-class WindowContent(Widget):
-    """Widget to render window pane content."""
-
-    def __init__(self, content: str, **kwargs: Any) -> None:
-        """Initialize with content."""
-        super().__init__(**kwargs)
-        self.content = content
-
-    def render(self) -> RenderableType:
-        """Render the window content."""
-        return Text(self.content, style="white on default", no_wrap=False, overflow="fold")
+        content = str(self.window_data.get("content", ""))
+        # Content keeps the base style; the title bar's span overrides it
+        text = Text(style="white on default", no_wrap=False, overflow="fold")
+        text.append_text(title)
+        text.append("\n")
+        text.append(content)
+        return text
 
 
 class TmuxPanePreview(Widget):
@@ -318,13 +356,24 @@ class TmuxPanePreview(Widget):
 
     worktree_name: reactive[str] = reactive("")
 
+    # Prefetched preview for the next worktree_name change, if the caller had one
+    _pending_preview: list[dict[str, str | bool]] | str | None = None
+
     def compose(self) -> ComposeResult:
         """Compose the initial empty state."""
         yield Horizontal(id="windows-container")
 
-    def update_content(self, worktree_name: str) -> None:
-        """Update the display with pane preview for the given worktree."""
+    def update_content(self, worktree_name: str,
+                       preview_data: list[dict[str, str | bool]] | str | None = None) -> None:
+        """Update the display with pane preview for the given worktree.
+
+        Args:
+            worktree_name: The worktree to show
+            preview_data: Prefetched get_tmux_pane_preview() result (fetched here if None)
+        """
+        self._pending_preview = preview_data
         self.worktree_name = worktree_name
+        self._pending_preview = None
 
     def watch_worktree_name(self, worktree_name: str) -> None:
         """React to worktree name changes and rebuild the windows display."""
@@ -335,7 +384,9 @@ class TmuxPanePreview(Widget):
             container.mount(Static("Select a worktree to view tmux pane preview", classes="preview-placeholder"))
             return
 
-        preview_data = get_tmux_pane_preview(worktree_name)
+        preview_data = self._pending_preview
+        if preview_data is None:
+            preview_data = get_tmux_pane_preview(worktree_name)
 
         # String response means a status/error message
         if isinstance(preview_data, str):
@@ -358,21 +409,30 @@ class MetadataDisplay(VerticalScroll):
         Binding("k", "scroll_up", "Scroll up", show=False),
     ]
 
+    # Placeholder Markdown shown when there is no pr.md content to display
+    _NO_SELECTION = "*Select a worktree to view PR description*"
+    _NO_DESCRIPTION = "*No PR description available*"
+
+    # Markdown source currently shown, so unchanged content isn't re-parsed
+    _displayed_markdown: str = _NO_SELECTION
+
     def compose(self) -> ComposeResult:
         """Compose the markdown display."""
-        yield Markdown("*Select a worktree to view PR description*", id="metadata_markdown")
+        yield Markdown(self._displayed_markdown, id="metadata_markdown")
 
     def update_content(self, worktree_name: str) -> None:
-        """Update the display with metadata for the given worktree."""
-        markdown = self.query_one("#metadata_markdown", Markdown)
+        """Update the display with metadata for the given worktree.
 
+        pr.md is read through the mtime-keyed file cache, and the Markdown
+        widget is only re-rendered when the text to show actually changes.
+        """
         if not worktree_name:
-            markdown.update("*Select a worktree to view PR description*")
-            return
+            content = self._NO_SELECTION
+        else:
+            content = get_worktree_metadata(worktree_name) or self._NO_DESCRIPTION
 
-        metadata = get_worktree_metadata(worktree_name)
+        if content == self._displayed_markdown:
+            return
 
-        if metadata:
-            markdown.update(metadata)
-        else:
-            markdown.update("*No PR description available*")
+        self._displayed_markdown = content
+        self.query_one("#metadata_markdown", Markdown).update(content)
@@ -1,69 +1,231 @@
 """Shared fixtures and utilities for Grove tests."""
 
+import functools
 import os
+import shutil
+import tomllib
 import pytest
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, Generator
 
+try:
+    import rtoml
+except ImportError:
+    rtoml = None
+
+
+_EXAMPLE_REPO_SOURCE = Path(__file__).parent / "example_repo"
 
-@pytest.fixture
-def example_repo_path() -> Path:
-    """Fixture that provides the path to the example repo."""
-    return Path(__file__).parent / "example_repo"
+
+@pytest.fixture(scope="session")
+def example_repo_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture that provides the path to a session-wide copy of the example repo.
+
+    The checked-in repo is copied once per session (once per worker under
+    pytest-xdist) so files tests write into worktrees never land in the
+    source tree. The copy keeps the "example_repo" directory name that the UI
+    and snapshots display, and the path is returned already resolved so tests
+    can compare it directly with the resolved paths config functions return.
+    """
+    snapshot_path = tmp_path_factory.mktemp("repos") / "example_repo"
+    shutil.copytree(
+        _EXAMPLE_REPO_SOURCE,
+        snapshot_path,
+        symlinks=True,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    return snapshot_path.resolve()
 
 
 @pytest.fixture
 def change_to_example_repo(example_repo_path: Path) -> Generator[Path, None, None]:
-    """Fixture that temporarily changes working directory to example repo."""
-    original_cwd = os.getcwd()
-    os.chdir(example_repo_path)
-    yield example_repo_path
-    os.chdir(original_cwd)
+    """Fixture that temporarily changes working directory to example repo.
+
+    The original directory is held open and restored with fchdir(), which
+    skips resolving its path again and still works if the test renamed it.
+    """
+    original_cwd_fd = os.open(".", os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.chdir(example_repo_path)
+        yield example_repo_path
+    finally:
+        os.fchdir(original_cwd_fd)
+        os.close(original_cwd_fd)
 
 
 @pytest.fixture(autouse=True)
-def mock_config(
-    request: pytest.FixtureRequest,
-    tmp_path: Path,
-    example_repo_path: Path,
-    monkeypatch: pytest.MonkeyPatch
-) -> Path | None:
-    """Auto-use fixture that sets up config for all tests except config tests.
+def clear_repo_cache() -> Generator[None, None, None]:
+    """Auto-use fixture that drops cached Repo handles, git info and file reads so state doesn't leak between tests."""
+    from src.utils import invalidate_file_cache, invalidate_git_info_cache, invalidate_repo_cache
+
+    invalidate_repo_cache()
+    invalidate_git_info_cache()
+    invalidate_file_cache()
+    yield
+    invalidate_repo_cache()
+    invalidate_git_info_cache()
+    invalidate_file_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache() -> Generator[None, None, None]:
+    """Auto-use fixture that drops cached tmux session names so mocks don't leak between tests."""
+    from src.utils import invalidate_session_cache
+
+    invalidate_session_cache()
+    yield
+    invalidate_session_cache()
+
 
-    Skip this fixture for tests in test_config.py to avoid conflicts.
+def _toml_string(value: str) -> str:
+    """Quote a value as a TOML basic string."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@functools.lru_cache(maxsize=None)
+def _v2_config_bytes(repos: tuple[tuple[str, str], ...], last_used: str | None) -> bytes:
+    """Build a v2.0 config file from a template, cached per (repos, last_used).
+
+    Args:
+        repos: (name, path) pairs written as [[repositories]] entries
+        last_used: Optional path written as grove.last_used
+
+    Returns:
+        The TOML document as bytes
     """
-    # Skip for config tests - they manage their own config
-    if "test_config" in request.node.nodeid:
-        return None
+    lines = ["[grove]", 'config_version = "2.0"']
+    if last_used is not None:
+        lines.append(f"last_used = {_toml_string(last_used)}")
+    for name, path in repos:
+        lines += ["", "[[repositories]]", f"name = {_toml_string(name)}", f"path = {_toml_string(path)}"]
+    return ("\n".join(lines) + "\n").encode()
+
 
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    """Fixture that provides a config file path inside a fresh .config/grove directory.
+
+    Only the directory is created; tests write whatever file contents they need.
+    """
     config_dir = tmp_path / ".config" / "grove"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    config_file = config_dir / "config"
+    config_dir.mkdir(parents=True)
+    return config_dir / "config"
+
+
+@pytest.fixture
+def patched_config_path(monkeypatch: pytest.MonkeyPatch) -> Callable[[Path], None]:
+    """Fixture that points src.config.get_config_path at a given file.
+
+    Returns:
+        A function taking the config file path to use for the rest of the test
+    """
+    from src import config
+
+    def _set(config_file: Path) -> None:
+        monkeypatch.setattr(config, "get_config_path", lambda: config_file)
+
+    return _set
+
+
+@pytest.fixture
+def write_config() -> Callable[..., None]:
+    """Fixture that writes a v2.0 config file without going through tomli_w.
+
+    Returns:
+        A function taking the config file, a list of (name, path) repository
+        pairs and an optional last_used path
+    """
+    def _write(config_file: Path, repos: list[tuple[str, str]], last_used: str | None = None) -> None:
+        config_file.write_bytes(_v2_config_bytes(tuple(repos), last_used))
+
+    return _write
+
+
+@pytest.fixture
+def read_config() -> Callable[[Path], dict[str, Any]]:
+    """Fixture that parses a config file, with rtoml when it is installed.
+
+    Returns:
+        A function taking the config file and returning its parsed contents
+    """
+    def _read(config_file: Path) -> dict[str, Any]:
+        if rtoml is not None:
+            return rtoml.load(config_file)
+        with open(config_file, "rb") as f:
+            return tomllib.load(f)
+
+    return _read
+
+
+@pytest.fixture(scope="session")
+def session_config_file(tmp_path_factory: pytest.TempPathFactory, example_repo_path: Path) -> Path:
+    """Fixture that writes the test config once per session.
+
+    The config only depends on the example repo path, and tests that change
+    config contents (test_config.py) use their own files, so every test can
+    share this one.
+    """
+    config_file = tmp_path_factory.mktemp("grove-config") / "config"
 
     # Write config with v2.0 format
-    import tomli_w
-
-    config_data = {
-        "grove": {
-            "config_version": "2.0",
-            "last_used": str(example_repo_path),
-        },
-        "repositories": [
-            {
-                "name": example_repo_path.name,
-                "path": str(example_repo_path),
-            }
-        ],
-    }
-    with open(config_file, "wb") as f:
-        tomli_w.dump(config_data, f)
-
-    # Mock get_config_path to return our temp config
+    config_file.write_bytes(
+        _v2_config_bytes(((example_repo_path.name, str(example_repo_path)),), str(example_repo_path))
+    )
+    return config_file
+
+
+@pytest.fixture
+def mock_config(
+    example_repo_path: Path,
+    session_config_file: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Fixture that points config at the shared session config and activates the example repo.
+
+    Applied to every test by pytest_collection_modifyitems() unless the test
+    is marked no_config.
+    """
+    # Mock get_config_path to return the shared session config
     from src import config
 
-    monkeypatch.setattr(config, "get_config_path", lambda: config_file)
+    monkeypatch.setattr(config, "get_config_path", lambda: session_config_file)
 
     # Set active repository for tests
     config.set_active_repo(example_repo_path)
 
-    return config_file
\ No newline at end of file
+    return session_config_file
+
+
+# Options that read or write the pytest cache; any of them keeps it on locally
+_CACHE_OPTIONS = ("lf", "failedfirst", "newfirst", "stepwise", "stepwise_skip", "cacheshow", "cacheclear")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Turn off the pytest cache plugin's bookkeeping on plain local runs.
+
+    Outside CI (the CI environment variable unset) the last-failed and
+    new-first trackers are unregistered, so no .pytest_cache is written.
+    Runs that ask for the cache (--lf, --ff, --nf, --sw, --cache-show,
+    --cache-clear) keep the plugin fully active, as does CI.
+    """
+    if os.environ.get("CI") or any(config.getoption(name, None) for name in _CACHE_OPTIONS):
+        return
+    for name in ("lfplugin", "nfplugin"):
+        plugin = config.pluginmanager.get_plugin(name)
+        if plugin is not None:
+            config.pluginmanager.unregister(plugin)
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Request mock_config for every test not marked no_config.
+
+    Tests that manage their own config (test_config.py) or don't touch config
+    at all skip the fixture, and with it the per-test monkeypatch setup.
+    """
+    for item in items:
+        if item.get_closest_marker("no_config") is None and isinstance(item, pytest.Function):
+            # Set up before the test's own fixtures, as an autouse fixture
+            # would be, so fixtures that activate another repo still win
+            if "mock_config" not in item.fixturenames:
+                item.fixturenames.insert(0, "mock_config")
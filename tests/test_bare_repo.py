@@ -1,9 +1,10 @@
 """Tests for bare git repository detection and worktree directory listing."""
 
-import os
+import pytest
 from pathlib import Path
 
 from src import get_worktree_directories, is_bare_git_repository
+from src.config import set_active_repo
 
 
 class TestBareRepository:
@@ -26,26 +27,30 @@ class TestBareRepository:
         assert ".git" not in directories
         assert ".grove" not in directories
 
-    def test_get_worktree_directories_outside_bare_repo(self, tmp_path: Path) -> None:
+    def test_get_worktree_directories_outside_bare_repo(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that get_worktree_directories works based on config, not current directory."""
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            # With config-based system, worktrees are found via config regardless of cwd
-            directories = get_worktree_directories()
-            # Should still find the configured repo's worktrees
-            expected_directories = ["bugfix-01", "feature-one"]
-            assert directories == expected_directories
-        finally:
-            os.chdir(original_cwd)
-
-    def test_is_bare_git_repository_outside_bare_repo(self, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        # With config-based system, worktrees are found via config regardless of cwd
+        directories = get_worktree_directories()
+        # Should still find the configured repo's worktrees
+        expected_directories = ["bugfix-01", "feature-one"]
+        assert directories == expected_directories
+
+    def test_is_bare_git_repository_outside_bare_repo(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that is_bare_git_repository returns False when not in a bare repo."""
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
+
+        assert is_bare_git_repository() is False
+
+    def test_get_worktree_directories_skips_files_and_hidden_entries(self, tmp_path: Path) -> None:
+        """Test that only visible directories (including symlinked ones) are listed."""
+        (tmp_path / ".bare").mkdir()
+        (tmp_path / ".hidden-dir").mkdir()
+        (tmp_path / "feature-a").mkdir()
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "linked").symlink_to(tmp_path / "feature-a")
+        (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+        set_active_repo(tmp_path)
 
-        try:
-            assert is_bare_git_repository() is False
-        finally:
-            os.chdir(original_cwd)
\ No newline at end of file
+        assert get_worktree_directories() == ["feature-a", "linked"]
@@ -1,81 +1,69 @@
 """Integration tests for CLI functionality."""
 
 import pytest
-import subprocess
+import runpy
 import sys
 from pathlib import Path
 
+from src.__main__ import main
+
 
 class TestCLI:
     """Integration tests for grove CLI."""
 
-    def test_grove_help(self) -> None:
-        """Test that grove --help works."""
-        result = subprocess.run(
-            [sys.executable, "-m", "src", "--help"], capture_output=True, text=True
-        )
-
-        assert result.returncode == 0
-        assert "grove" in result.stdout
-        assert "Git Worktree and Tmux Session Manager" in result.stdout
-        assert "clone" in result.stdout
-
-    def test_grove_clone_help(self) -> None:
+    def test_grove_help(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that grove --help works when run as a module (entry point smoke test)."""
+        # Execute src/__main__.py the way `python -m src` does, without a new
+        # interpreter; the module imported above is set aside so it runs fresh
+        monkeypatch.delitem(sys.modules, "src.__main__")
+        monkeypatch.setattr(sys, "argv", ["grove", "--help"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            runpy.run_module("src", run_name="__main__", alter_sys=True)
+
+        stdout = capsys.readouterr().out
+        assert exc_info.value.code == 0
+        assert "grove" in stdout
+        assert "Git Worktree and Tmux Session Manager" in stdout
+        assert "clone" in stdout
+
+    def test_grove_clone_help(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test that grove clone --help works."""
-        result = subprocess.run(
-            [sys.executable, "-m", "src", "clone", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "usage: grove clone" in result.stdout
-        assert "Git repository URL to clone" in result.stdout
-        assert "Target directory name" in result.stdout
-
-    def test_grove_clone_invalid_url(self, tmp_path: Path) -> None:
+        with pytest.raises(SystemExit) as exc_info:
+            main(["clone", "--help"])
+
+        stdout = capsys.readouterr().out
+        assert exc_info.value.code == 0
+        assert "usage: grove clone" in stdout
+        assert "Git repository URL to clone" in stdout
+        assert "Target directory name" in stdout
+
+    def test_grove_clone_invalid_url(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test that grove clone rejects invalid URLs."""
-        import os
+        monkeypatch.chdir(tmp_path)
 
-        # Get project root directory
-        project_root = Path(__file__).parent.parent
+        with pytest.raises(SystemExit) as exc_info:
+            main(["clone", "not-a-valid-url"])
 
-        result = subprocess.run(
-            [sys.executable, "-m", "src", "clone", "not-a-valid-url"],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path,
-            env={**os.environ, "PYTHONPATH": str(project_root)},
-        )
+        assert exc_info.value.code == 1
+        assert "Invalid Git URL" in capsys.readouterr().err
 
-        assert result.returncode == 1
-        assert "Invalid Git URL" in result.stderr
-
-    def test_grove_clone_existing_directory(self, tmp_path: Path) -> None:
+    def test_grove_clone_existing_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test that grove clone rejects existing directories."""
-        import os
-
-        # Get project root directory
-        project_root = Path(__file__).parent.parent
+        monkeypatch.chdir(tmp_path)
 
         # Create directory first
         test_dir = tmp_path / "existing-dir"
         test_dir.mkdir()
 
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "src",
-                "clone",
-                "https://github.com/user/repo.git",
-                "existing-dir",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path,
-            env={**os.environ, "PYTHONPATH": str(project_root)},
-        )
-
-        assert result.returncode == 1
-        assert "already exists" in result.stderr
+        with pytest.raises(SystemExit) as exc_info:
+            main(["clone", "https://github.com/user/repo.git", "existing-dir"])
+
+        assert exc_info.value.code == 1
+        assert "already exists" in capsys.readouterr().err
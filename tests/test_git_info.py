@@ -1,24 +1,28 @@
 """Tests for git information retrieval functionality."""
 
 import os
+import shutil
+import subprocess
 from pathlib import Path
 from subprocess import CompletedProcess
 from typing import Any
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from src import get_worktree_git_info
+from src.config import set_active_repo
+from src.utils import check_remote_branch_exists, get_worktree_git_log
 
 
 class TestGitInfo:
     """Tests for git information functionality."""
 
-    @patch('src.utils.Repo')
-    def test_get_worktree_git_info_success(self, mock_repo: Any, change_to_example_repo: Path) -> None:
+    @patch('src.utils._git')
+    def test_get_worktree_git_info_success(self, mock_git: Any, change_to_example_repo: Path) -> None:
         """Test that get_worktree_git_info correctly parses git log output."""
-        # Mock successful git log command using GitPython
-        mock_repo_instance = MagicMock()
-        mock_repo_instance.git.log.return_value = 'Add authentication system\n2024-09-28 10:30:45 -0700\nJohn Doe <john@example.com>\n'
-        mock_repo.return_value = mock_repo_instance
+        # Mock successful git log command
+        mock_git.return_value = b'Add authentication system\n2024-09-28 10:30:45 -0700\nJohn Doe <john@example.com>\n'
 
         git_info = get_worktree_git_info("feature-one")
 
@@ -26,11 +30,11 @@ class TestGitInfo:
         assert git_info["commit_date"] == "2024-09-28 10:30:45 -0700"
         assert git_info["committer"] == "John Doe <john@example.com>"
 
-    @patch('src.utils.Repo')
-    def test_get_worktree_git_info_failure(self, mock_repo: Any, change_to_example_repo: Path) -> None:
+    @patch('src.utils._git')
+    def test_get_worktree_git_info_failure(self, mock_git: Any, change_to_example_repo: Path) -> None:
         """Test that get_worktree_git_info handles git command failure gracefully."""
         # Mock failed git log command by raising an exception
-        mock_repo.side_effect = Exception("Git error")
+        mock_git.side_effect = subprocess.CalledProcessError(128, ['git', 'log'])
 
         git_info = get_worktree_git_info("feature-one")
 
@@ -49,4 +53,323 @@ class TestGitInfo:
             assert git_info["commit_date"] == "N/A"
             assert git_info["committer"] == "N/A"
         finally:
-            os.chdir(original_cwd)
\ No newline at end of file
+            os.chdir(original_cwd)
+
+    @patch('src.utils.get_tmux_pane_preview')
+    @patch('src.utils.get_worktree_git_log')
+    @patch('src.utils.get_worktree_git_status')
+    def test_get_worktree_details(self, mock_status: Any, mock_log: Any, mock_preview: Any) -> None:
+        """Test that get_worktree_details returns status, log and pane preview for one worktree."""
+        from src.utils import get_worktree_details
+
+        mock_status.return_value = {"staged": [], "unstaged": [], "untracked": []}
+        mock_log.return_value = {"sync_status": "ahead"}
+        mock_preview.return_value = "No active tmux session"
+
+        assert get_worktree_details("feature-one") == (
+            {"staged": [], "unstaged": [], "untracked": []},
+            {"sync_status": "ahead"},
+            "No active tmux session",
+        )
+        for mock in (mock_status, mock_log, mock_preview):
+            mock.assert_called_once_with("feature-one")
+
+    @patch('src.utils.Repo')
+    def test_repo_handle_is_reused(self, mock_repo: Any, change_to_example_repo: Path) -> None:
+        """Test that repeated git queries reuse one Repo handle until the cache is invalidated."""
+        from src.utils import invalidate_repo_cache
+
+        check_remote_branch_exists(Path("feature-one"))
+        check_remote_branch_exists(Path("feature-one"))
+        assert mock_repo.call_count == 1
+
+        invalidate_repo_cache()
+        check_remote_branch_exists(Path("feature-one"))
+        assert mock_repo.call_count == 2
+
+    @patch('src.utils.Repo', side_effect=lambda path: MagicMock())
+    def test_repo_handles_are_not_shared_between_threads(self, mock_repo: Any) -> None:
+        """Test that each thread gets its own Repo handle and invalidation reaches every thread."""
+        from concurrent.futures import ThreadPoolExecutor
+        from src.utils import _repo_for, invalidate_repo_cache
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            main_handle = _repo_for("/repo")
+            worker_handle = pool.submit(_repo_for, "/repo").result()
+            assert main_handle is not worker_handle
+            assert pool.submit(_repo_for, "/repo").result() is worker_handle
+            assert _repo_for("/repo") is main_handle
+
+            invalidate_repo_cache()
+            assert pool.submit(_repo_for, "/repo").result() is not worker_handle
+
+
+def _git(cwd: Path, *args: str) -> None:
+    """Run a git command in the given directory, failing the test on error."""
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+class TestGitLog:
+    """Tests for git log and sync status retrieval against a real repository."""
+
+    @pytest.fixture
+    def repo_with_worktree(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Create a repo whose 'wt' worktree has two pushed commits and one unpushed commit."""
+        for key in ("AUTHOR", "COMMITTER"):
+            monkeypatch.setenv(f"GIT_{key}_NAME", "Jane Doe")
+            monkeypatch.setenv(f"GIT_{key}_EMAIL", "jane@example.com")
+
+        origin = tmp_path / "origin.git"
+        _git(tmp_path, "init", "--bare", "-b", "main", str(origin))
+
+        repo_root = tmp_path / "repo"
+        (repo_root / ".bare").mkdir(parents=True)
+        worktree = repo_root / "wt"
+        _git(tmp_path, "clone", str(origin), str(worktree))
+        _git(worktree, "checkout", "-b", "main")
+        for message in ("First commit", "Second commit"):
+            _git(worktree, "commit", "--allow-empty", "-m", message)
+        _git(worktree, "push", "-u", "origin", "main")
+        _git(worktree, "commit", "--allow-empty", "-m", "Local commit\n\nWith a body")
+
+        set_active_repo(repo_root)
+        return worktree
+
+    def test_get_worktree_git_log_ahead_of_upstream(self, repo_with_worktree: Path) -> None:
+        """Test that ahead counts and pushed flags come from the upstream branch."""
+        log_data = get_worktree_git_log("wt")
+
+        assert log_data["sync_status"] == "ahead"
+        assert log_data["ahead_count"] == 1
+        assert log_data["behind_count"] == 0
+        assert log_data["comparison_branch"] == "main"
+
+        commits = log_data["commits"]
+        assert [c["message"] for c in commits] == ["Local commit", "Second commit", "First commit"]
+        assert [c["is_pushed"] for c in commits] == [False, True, True]
+        assert all(c["author"] == "Jane Doe" for c in commits)
+        assert all(len(c["hash"]) == 7 for c in commits)
+        assert commits[0]["date"] == "just now"
+
+    def test_get_worktree_git_log_limits_commits(self, repo_with_worktree: Path) -> None:
+        """Test that only the most recent max_commits commits are listed."""
+        log_data = get_worktree_git_log("wt", max_commits=2)
+
+        assert log_data["ahead_count"] == 1
+        assert [c["message"] for c in log_data["commits"]] == ["Local commit", "Second commit"]
+
+    def test_get_worktree_git_log_behind_upstream(self, repo_with_worktree: Path) -> None:
+        """Test that commits only on the upstream branch count as behind."""
+        _git(repo_with_worktree, "push", "origin", "main")
+        _git(repo_with_worktree, "reset", "--hard", "HEAD~2")
+
+        log_data = get_worktree_git_log("wt")
+
+        assert log_data["sync_status"] == "behind"
+        assert log_data["ahead_count"] == 0
+        assert log_data["behind_count"] == 2
+        assert [c["is_pushed"] for c in log_data["commits"]] == [True]
+
+    def test_get_worktree_git_log_up_to_date_skips_rev_list(self, repo_with_worktree: Path) -> None:
+        """Test that a branch at the same commit as its upstream is up to date without walking history."""
+        from src import utils
+
+        _git(repo_with_worktree, "push", "origin", "main")
+
+        with patch('src.utils._git', wraps=utils._git) as mock_git:
+            log_data = get_worktree_git_log("wt")
+
+        assert log_data["sync_status"] == "up-to-date"
+        assert (log_data["ahead_count"], log_data["behind_count"]) == (0, 0)
+        assert [call.args[1] for call in mock_git.call_args_list] == ["log"]
+
+    def test_commit_list_skips_rev_list_when_not_ahead(self, repo_with_worktree: Path) -> None:
+        """Test that no unpushed-commit lookup runs when the branch is known not to be ahead."""
+        from src import utils
+
+        with patch('src.utils._git', wraps=utils._git) as mock_git:
+            commits = utils._get_commit_list(repo_with_worktree, "main", "origin/main", 20, ahead_count=0)
+
+        assert [call.args[1] for call in mock_git.call_args_list] == ["log"]
+        assert all(c["is_pushed"] for c in commits)
+
+    @pytest.mark.parametrize("seconds_ago, expected", [
+        (30, "just now"),
+        (60, "just now"),
+        (61, "1 minute ago"),
+        (59 * 60, "59 minutes ago"),
+        (3601, "1 hour ago"),
+        (23 * 3600, "23 hours ago"),
+        (86400, "1 day ago"),
+        (2 * 86400, "2 days ago"),
+        (31 * 86400, "1 month ago"),
+        (365 * 86400, "12 months ago"),
+        (366 * 86400, "1 year ago"),
+        (3 * 366 * 86400, "3 years ago"),
+    ])
+    def test_format_relative_date(self, seconds_ago: int, expected: str) -> None:
+        """Test relative date buckets and pluralization."""
+        from src.utils import _format_relative_date
+
+        now = 1_700_000_000
+        assert _format_relative_date(now - seconds_ago, now) == expected
+
+    def test_check_remote_branch_exists(self, repo_with_worktree: Path) -> None:
+        """Test that only a gone upstream branch is reported as missing."""
+        from src.utils import check_remote_branch_exists
+
+        assert check_remote_branch_exists(repo_with_worktree) is True
+
+        # Simulate the remote branch being deleted and pruned
+        _git(repo_with_worktree, "update-ref", "-d", "refs/remotes/origin/main")
+        assert check_remote_branch_exists(repo_with_worktree) is False
+
+    def test_check_remote_branch_exists_reads_refs_in_process(self, repo_with_worktree: Path) -> None:
+        """Test that the upstream lookup finds packed refs without running git."""
+        from src.utils import check_remote_branch_exists
+
+        _git(repo_with_worktree, "pack-refs", "--all")
+        with patch('git.cmd.safer_popen') as mock_popen:
+            assert check_remote_branch_exists(repo_with_worktree) is True
+        mock_popen.assert_not_called()
+
+    def test_check_remote_branch_exists_without_upstream(self, repo_with_worktree: Path) -> None:
+        """Test that a branch without an upstream is assumed to exist."""
+        from src.utils import check_remote_branch_exists
+
+        _git(repo_with_worktree, "checkout", "-b", "local-only")
+        assert check_remote_branch_exists(repo_with_worktree) is True
+
+    def test_prime_worktree_git_info_matches_per_worktree_lookup(self, repo_with_worktree: Path) -> None:
+        """Test that bulk-loaded commit info matches git log and is served without running git."""
+        from src import utils
+
+        repo_root = repo_with_worktree.parent
+        _git(repo_root, "clone", "--bare", str(repo_root.parent / "origin.git"), ".bare")
+        _git(repo_root / ".bare", "worktree", "add", str(repo_root / "feature-x"), "main")
+
+        expected = utils.get_worktree_git_info("feature-x")
+        assert expected["commit_message"] == "Second commit"
+
+        utils.prime_worktree_git_info(["feature-x"])
+        with patch('src.utils._git', side_effect=AssertionError("git was run")):
+            assert utils.get_worktree_git_info("feature-x") == expected
+            assert utils.check_remote_branch_exists(repo_root / "feature-x") is True
+
+    def test_primed_git_info_ignored_once_stale(self, repo_with_worktree: Path) -> None:
+        """Test that primed info isn't served after HEAD moves or the worktree is removed."""
+        from src import utils
+
+        repo_root = repo_with_worktree.parent
+        _git(repo_root, "clone", "--bare", str(repo_root.parent / "origin.git"), ".bare")
+        _git(repo_root / ".bare", "worktree", "add", str(repo_root / "feature-x"), "main")
+
+        utils.prime_worktree_git_info(["feature-x"])
+        _git(repo_root / "feature-x", "commit", "--allow-empty", "-m", "Newer commit")
+        assert utils.get_worktree_git_info("feature-x")["commit_message"] == "Newer commit"
+
+        utils.prime_worktree_git_info(["feature-x"])
+        shutil.rmtree(repo_root / "feature-x")
+        assert utils.get_worktree_git_info("feature-x")["commit_message"] == "N/A"
+
+    def test_prime_worktree_git_info_loads_detached_worktrees(self, repo_with_worktree: Path) -> None:
+        """Test that worktrees with a detached HEAD are bulk-loaded too."""
+        from src import utils
+
+        repo_root = repo_with_worktree.parent
+        _git(repo_root, "clone", "--bare", str(repo_root.parent / "origin.git"), ".bare")
+        _git(repo_root / ".bare", "worktree", "add", "--detach", str(repo_root / "detached-x"), "main~1")
+
+        utils.prime_worktree_git_info(["detached-x"])
+        with patch('src.utils._git', side_effect=AssertionError("git was run")):
+            info = utils.get_worktree_git_info("detached-x")
+            assert utils.check_remote_branch_exists(repo_root / "detached-x") is True
+
+        assert info["commit_message"] == "First commit"
+        assert info["committer"] == "Jane Doe <jane@example.com>"
+
+    def test_prime_worktree_git_info_reports_gone_upstreams(self, repo_with_worktree: Path) -> None:
+        """Test that upstream state for many worktrees comes from one batch of git calls."""
+        from src import utils
+
+        repo_root = repo_with_worktree.parent
+        bare = repo_root / ".bare"
+        _git(repo_root, "clone", "--bare", str(repo_root.parent / "origin.git"), ".bare")
+        _git(bare, "config", "remote.origin.fetch", "+refs/heads/*:refs/remotes/origin/*")
+        _git(bare, "fetch", "origin")
+        for branch in ("kept", "gone"):
+            _git(bare, "branch", branch, "main")
+            _git(bare, "config", f"branch.{branch}.remote", "origin")
+            _git(bare, "config", f"branch.{branch}.merge", f"refs/heads/{branch}")
+            _git(bare, "worktree", "add", str(repo_root / branch), branch)
+        _git(bare, "update-ref", "refs/remotes/origin/kept", "main")
+
+        with patch('src.utils._git', wraps=utils._git) as mock_git:
+            utils.prime_worktree_git_info(["kept", "gone"])
+            assert utils.check_remote_branch_exists(repo_root / "kept") is True
+            assert utils.check_remote_branch_exists(repo_root / "gone") is False
+
+        assert [call.args[1] for call in mock_git.call_args_list] == ["worktree", "for-each-ref"]
+
+
+class TestGitStatus:
+    """Tests for git status parsing against a real repository."""
+
+    def test_get_worktree_git_status(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that staged, unstaged, untracked and renamed files are classified correctly."""
+        from src.utils import get_worktree_git_status
+
+        for key in ("AUTHOR", "COMMITTER"):
+            monkeypatch.setenv(f"GIT_{key}_NAME", "Jane Doe")
+            monkeypatch.setenv(f"GIT_{key}_EMAIL", "jane@example.com")
+
+        (tmp_path / ".bare").mkdir()
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        _git(worktree, "init", "-b", "main")
+        for name in ("modified.txt", "both.txt", "old name.txt"):
+            (worktree / name).write_text("original\n")
+        _git(worktree, "add", ".")
+        _git(worktree, "commit", "-m", "Initial commit")
+
+        (worktree / "modified.txt").write_text("changed\n")
+        (worktree / "both.txt").write_text("staged change\n")
+        _git(worktree, "add", "both.txt")
+        (worktree / "both.txt").write_text("unstaged change\n")
+        (worktree / "added.txt").write_text("new\n")
+        _git(worktree, "add", "added.txt")
+        _git(worktree, "mv", "old name.txt", "new name.txt")
+        (worktree / "untracked file.txt").write_text("?\n")
+
+        set_active_repo(tmp_path)
+        status = get_worktree_git_status("wt")
+
+        assert sorted(status["staged"]) == ["added.txt", "both.txt", "new name.txt"]
+        assert sorted(status["unstaged"]) == ["both.txt", "modified.txt"]
+        assert status["untracked"] == ["untracked file.txt"]
+
+    def test_get_worktree_git_status_leaves_index_untouched(self, tmp_path: Path) -> None:
+        """Test that reading status doesn't refresh and rewrite the worktree's index."""
+        from src.utils import get_worktree_git_status
+
+        (tmp_path / ".bare").mkdir()
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        _git(worktree, "init", "-b", "main")
+        (worktree / "file.txt").write_text("same\n")
+        _git(worktree, "add", "file.txt")
+
+        # Same content with a new mtime leaves a stale stat entry in the index
+        index = worktree / ".git" / "index"
+        index_stat = index.stat()
+        os.utime(worktree / "file.txt", ns=(index_stat.st_mtime_ns + 10**9,) * 2)
+
+        set_active_repo(tmp_path)
+        assert get_worktree_git_status("wt")["unstaged"] == []
+        assert index.stat().st_mtime_ns == index_stat.st_mtime_ns
+
+    def test_get_worktree_git_status_missing_worktree(self, change_to_example_repo: Path) -> None:
+        """Test that a missing worktree reports no changes."""
+        from src.utils import get_worktree_git_status
+
+        assert get_worktree_git_status("nonexistent-worktree") == {"staged": [], "unstaged": [], "untracked": []}
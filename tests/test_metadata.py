@@ -58,4 +58,22 @@ class TestMetadata:
             metadata_display.update_content("")
             # Get the markdown content that was set via update()
             content = str(markdown._markdown) if hasattr(markdown, '_markdown') else ""
-            assert "Select a worktree to view PR description" in content
\ No newline at end of file
+            assert "Select a worktree to view PR description" in content
+    async def test_metadata_display_skips_unchanged_content(self, change_to_example_repo: Path) -> None:
+        """Test that MetadataDisplay doesn't re-render markdown that is already shown."""
+        from unittest.mock import patch
+        from textual.widgets import Markdown
+
+        app = GroveApp()
+
+        async with app.run_test() as pilot:
+            metadata_display = app.query_one("#metadata", MetadataDisplay)
+            metadata_display.update_content("feature-one")
+
+            markdown = metadata_display.query_one("#metadata_markdown", Markdown)
+            with patch.object(markdown, 'update') as mock_update:
+                metadata_display.update_content("feature-one")
+                assert not mock_update.called
+
+                metadata_display.update_content("")
+                mock_update.assert_called_once_with("*Select a worktree to view PR description*")
@@ -1,6 +1,7 @@
 """Tests for PR status functionality."""
 
 import os
+import time
 from pathlib import Path
 
 from src import get_worktree_pr_status
@@ -30,4 +31,72 @@ class TestPRStatus:
             # feature-one has WORKTREE_PR_PUBLISHED=true in its .env
             assert pr_worktrees == {"feature-one"}
         finally:
-            os.chdir(original_cwd)
\ No newline at end of file
+            os.chdir(original_cwd)
+
+    def test_scan_worktrees(self, tmp_path: Path) -> None:
+        """Test that scan_worktrees lists visible directories with their PR state in one pass."""
+        from src import scan_worktrees
+        from src.config import set_active_repo
+
+        (tmp_path / ".bare").mkdir()
+        (tmp_path / "with-pr").mkdir()
+        (tmp_path / "with-pr" / ".env").write_text("WORKTREE_PR_PUBLISHED=true\n")
+        (tmp_path / "without-pr").mkdir()
+        (tmp_path / "README.md").write_text("")
+        set_active_repo(tmp_path)
+
+        assert scan_worktrees() == [
+            {"name": "with-pr", "path": str(tmp_path / "with-pr"), "has_pr": True},
+            {"name": "without-pr", "path": str(tmp_path / "without-pr"), "has_pr": False},
+        ]
+
+    def test_has_published_pr_matches_whole_line(self, tmp_path: Path) -> None:
+        """Test that only an exact WORKTREE_PR_PUBLISHED=true line marks a PR as published."""
+        from src.utils import _has_published_pr, invalidate_file_cache
+
+        # Missing .env file (remembered as missing until invalidated)
+        assert _has_published_pr(str(tmp_path)) is False
+        invalidate_file_cache(str(tmp_path / ".env"))
+
+        (tmp_path / ".env").write_text("FOO=bar\nWORKTREE_PR_PUBLISHED=trueish\n")
+        assert _has_published_pr(str(tmp_path)) is False
+
+        (tmp_path / ".env").write_text("FOO=bar\r\n  WORKTREE_PR_PUBLISHED=true  \r\nBAZ=1\n")
+        assert _has_published_pr(str(tmp_path)) is True
+
+    def test_read_cached_remembers_missing_file(self, tmp_path: Path) -> None:
+        """Test that a missing file isn't probed again until its entry expires or is invalidated."""
+        from unittest.mock import patch
+        from src import utils
+
+        env_file = str(tmp_path / ".env")
+        assert utils._read_cached(env_file) is None
+
+        (tmp_path / ".env").write_text("WORKTREE_PR_PUBLISHED=true\n")
+        with patch('src.utils.os.stat', side_effect=AssertionError("file was probed")):
+            assert utils._read_cached(env_file) is None
+
+        # Once the entry expires the file is found
+        with patch('src.utils.time.monotonic', return_value=time.monotonic() + utils.MISSING_FILE_CACHE_TTL):
+            assert utils._read_cached(env_file) == b"WORKTREE_PR_PUBLISHED=true\n"
+
+    def test_read_cached_reuses_unchanged_file(self, tmp_path: Path) -> None:
+        """Test that file contents are reused until the file's mtime or size changes."""
+        from unittest.mock import patch
+        from src.utils import _read_cached
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("WORKTREE_PR_PUBLISHED=true\n")
+        assert _read_cached(str(env_file)) == b"WORKTREE_PR_PUBLISHED=true\n"
+
+        # An unchanged file is served from the cache without reading it again
+        with patch('src.utils.open', side_effect=AssertionError("file was re-read"), create=True):
+            assert _read_cached(str(env_file)) == b"WORKTREE_PR_PUBLISHED=true\n"
+
+        # A modified file is read again
+        env_file.write_text("FOO=bar\n")
+        assert _read_cached(str(env_file)) == b"FOO=bar\n"
+
+        # A deleted file is reported as missing
+        env_file.unlink()
+        assert _read_cached(str(env_file)) is None
@@ -7,7 +7,7 @@ from unittest.mock import patch
 import pytest
 from textual.widgets import ListView, ListItem, Label
 
-from src import GroveApp, MetadataDisplay
+from src import GroveApp, MetadataDisplay, Sidebar
 
 
 class TestSidebar:
@@ -35,7 +35,7 @@ class TestSidebar:
 
             # Verify the expected directories are present with empty circle icons
             # Note: feature-one has a PR indicator because it has .env with WORKTREE_PR_PUBLISHED=true
-            expected_directories = ["○ bugfix-01", "○ [bold]PR[/bold] feature-one"]
+            expected_directories = ["○ bugfix-01", "○ PR feature-one"]
             assert directory_labels == expected_directories
 
     async def test_grove_app_starts_successfully(self, change_to_example_repo: Path) -> None:
@@ -112,16 +112,24 @@ class TestSidebar:
                 directory_labels.append(str(label.content))
 
             # Verify feature-one has PR indicator, bugfix-01 doesn't
-            expected_directories = ["○ bugfix-01", "○ [bold]PR[/bold] feature-one"]
+            expected_directories = ["○ bugfix-01", "○ PR feature-one"]
             assert directory_labels == expected_directories
 
+            # The PR indicator is styled bold and rows carry their worktree name
+            pr_label = list_items[1].query_one(Label)
+            assert [span.style for span in pr_label.content.spans] == ["bold"]
+            assert [item.name for item in list_items] == ["bugfix-01", "feature-one"]
+
     @patch('src.widgets.get_active_tmux_sessions')
-    @patch('src.widgets.get_worktree_pr_status')
-    async def test_sidebar_with_tmux_and_pr_indicators(self, mock_pr_status: Any, mock_sessions: Any, change_to_example_repo: Path) -> None:
+    @patch('src.widgets.scan_worktrees')
+    async def test_sidebar_with_tmux_and_pr_indicators(self, mock_scan: Any, mock_sessions: Any, change_to_example_repo: Path) -> None:
         """Test that sidebar shows both tmux and PR indicators correctly."""
         # Mock tmux session for bugfix-01 and PR for feature-one
         mock_sessions.return_value = {'example_repo/bugfix-01'}
-        mock_pr_status.return_value = {'feature-one'}
+        mock_scan.return_value = [
+            {"name": "bugfix-01", "path": str(change_to_example_repo / "bugfix-01"), "has_pr": False},
+            {"name": "feature-one", "path": str(change_to_example_repo / "feature-one"), "has_pr": True},
+        ]
         app = GroveApp()
 
         async with app.run_test() as pilot:
@@ -138,7 +146,7 @@ class TestSidebar:
                 directory_labels.append(str(label.content))
 
             # Verify bugfix-01 has filled circle, feature-one has PR indicator
-            expected_directories = ["● bugfix-01", "○ [bold]PR[/bold] feature-one"]
+            expected_directories = ["● bugfix-01", "○ PR feature-one"]
             assert directory_labels == expected_directories
 
     @patch('src.utils.get_active_tmux_sessions')
@@ -177,6 +185,147 @@ class TestSidebar:
             assert len(app.screen_stack) == 1
             assert not isinstance(app.screen, ConfirmDeleteScreen)
 
+    @patch('src.utils.get_active_tmux_sessions')
+    async def test_sidebar_refresh_runs_no_git(self, mock_sessions: Any, change_to_example_repo: Path) -> None:
+        """Test that refreshing the sidebar doesn't load git info nothing on screen uses."""
+        mock_sessions.return_value = set()
+        app = GroveApp()
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            sidebar = app.query_one("#sidebar", Sidebar)
+
+            with patch('src.utils._git') as mock_git:
+                sidebar.refresh_directories()
+
+            mock_git.assert_not_called()
+
+    @patch('src.widgets.get_active_tmux_sessions')
+    async def test_sidebar_refresh_updates_rows_in_place(self, mock_sessions: Any, change_to_example_repo: Path) -> None:
+        """Test that refreshes skip unchanged rows and relabel changed ones without rebuilding the list."""
+        mock_sessions.return_value = set()
+        app = GroveApp()
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            sidebar = app.query_one("#sidebar", Sidebar)
+            items = list(sidebar.query(ListItem))
+
+            with patch.object(sidebar, 'clear', wraps=sidebar.clear) as mock_clear:
+                sidebar.refresh_directories()
+                mock_sessions.return_value = {"example_repo/bugfix-01"}
+                sidebar.refresh_directories()
+                await pilot.pause()
+
+            mock_clear.assert_not_called()
+            assert list(sidebar.query(ListItem)) == items
+            assert str(items[0].query_one(Label).content) == "● bugfix-01"
+
+    @patch('src.utils.get_active_tmux_sessions')
+    async def test_git_panels_fetch_once_per_update(self, mock_sessions: Any, change_to_example_repo: Path) -> None:
+        """Test that git status and log are fetched on update, not again on every repaint."""
+        from src.widgets import GitLogDisplay, GitStatusDisplay
+        mock_sessions.return_value = set()
+        app = GroveApp()
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            with patch('src.widgets.get_worktree_git_status', return_value={"staged": [], "unstaged": ["a.py"], "untracked": []}) as mock_status, \
+                 patch('src.widgets.get_worktree_git_log', return_value={"sync_status": "no-upstream", "commits": []}) as mock_log:
+                app.query_one("#git_status", GitStatusDisplay).update_content("feature-one")
+                app.query_one("#git_log", GitLogDisplay).update_content("feature-one")
+                await pilot.pause()
+                await pilot.resize_terminal(100, 40)
+                await pilot.pause()
+
+            assert mock_status.call_count == 1
+            assert mock_log.call_count == 1
+
+    @patch('src.utils.get_active_tmux_sessions')
+    async def test_git_panels_reuse_rendered_text(self, mock_sessions: Any, change_to_example_repo: Path) -> None:
+        """Test that repaints reuse the built Text until the panel is updated again."""
+        from src.widgets import GitLogDisplay, GitStatusDisplay
+        mock_sessions.return_value = set()
+        app = GroveApp()
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            git_status = app.query_one("#git_status", GitStatusDisplay)
+            git_log = app.query_one("#git_log", GitLogDisplay)
+
+            git_status.update_content("feature-one", {"staged": [], "unstaged": ["a.py"], "untracked": []})
+            git_log.update_content("feature-one", {"sync_status": "no-upstream", "commits": []})
+            assert git_status.render() is git_status.render()
+            assert git_log.render() is git_log.render()
+
+            first = git_status.render()
+            git_status.update_content("feature-one", {"staged": ["b.py"], "unstaged": [], "untracked": []})
+            assert git_status.render() is not first
+            assert "b.py" in str(git_status.render())
+
+    @patch('src.utils.get_active_tmux_sessions')
+    async def test_git_panels_skip_refresh_for_unchanged_content(self, mock_sessions: Any, change_to_example_repo: Path) -> None:
+        """Test that re-showing the same worktree with the same data doesn't trigger a layout refresh."""
+        from src.widgets import GitLogDisplay, GitStatusDisplay
+        mock_sessions.return_value = set()
+        app = GroveApp()
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            git_status = app.query_one("#git_status", GitStatusDisplay)
+            git_log = app.query_one("#git_log", GitLogDisplay)
+            status = {"staged": [], "unstaged": ["a.py"], "untracked": []}
+            log_data = {"sync_status": "no-upstream", "commits": []}
+            git_status.update_content("preview-only", status)
+            git_log.update_content("preview-only", log_data)
+            rendered = git_status.render()
+
+            with patch.object(git_status, 'refresh') as status_refresh, \
+                 patch.object(git_log, 'refresh') as log_refresh:
+                git_status.update_content("preview-only", dict(status))
+                git_log.update_content("preview-only", dict(log_data))
+                status_refresh.assert_not_called()
+                log_refresh.assert_not_called()
+
+                git_status.update_content("preview-only", {"staged": ["b.py"], "unstaged": [], "untracked": []})
+                status_refresh.assert_called_once_with(layout=True)
+
+            assert git_status.render() is not rendered
+
+    @patch('src.utils.get_active_tmux_sessions')
+    async def test_worktree_details_load_in_worker_and_drop_stale_results(
+        self, mock_sessions: Any, change_to_example_repo: Path
+    ) -> None:
+        """Test that pane details are fetched in a worker and results for a deselected worktree are discarded."""
+        from src.widgets import GitStatusDisplay
+        mock_sessions.return_value = set()
+        app = GroveApp()
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            git_status = app.query_one("#git_status", GitStatusDisplay)
+            shown = git_status.worktree_name
+            assert shown == app.selected_worktree
+
+            # A late result for a worktree that is no longer selected is dropped
+            app._show_worktree_details("not-selected", {"staged": ["x.py"], "unstaged": [], "untracked": []}, None, None)
+            assert git_status.worktree_name == shown
+
+            # Selecting a worktree fills the panes once the worker finishes
+            with patch('src.app.get_worktree_details',
+                       return_value=({"staged": ["y.py"], "unstaged": [], "untracked": []},
+                                     {"sync_status": "no-upstream", "commits": []}, [])) as mock_details:
+                other = "feature-one" if shown == "bugfix-01" else "bugfix-01"
+                app.selected_worktree = other
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+            mock_details.assert_called_once_with(other)
+            assert git_status.worktree_name == other
+            assert git_status._status == {"staged": ["y.py"], "unstaged": [], "untracked": []}
+
     @patch('src.utils.get_active_tmux_sessions')
     async def test_auto_select_current_worktree_on_launch(self, mock_sessions: Any, change_to_example_repo: Path) -> None:
         """Test that Grove auto-selects the worktree user was in when launching."""
@@ -201,6 +350,15 @@ class TestSidebar:
             expected_index = worktrees.index("feature-one")
             assert sidebar.index == expected_index
 
+    def test_detect_current_worktree_reuses_given_list(self, change_to_example_repo: Path) -> None:
+        """Test that worktree detection uses a caller-provided listing instead of rescanning."""
+        import os
+        os.chdir(change_to_example_repo / "feature-one")
+
+        app = GroveApp()
+        with patch('src.app.get_worktree_directories', side_effect=AssertionError("rescanned")):
+            assert app.detect_current_worktree(["bugfix-01", "feature-one"]) == "feature-one"
+
     @patch('src.utils.get_active_tmux_sessions')
     async def test_auto_select_from_worktree_subdirectory(self, mock_sessions: Any, change_to_example_repo: Path) -> None:
         """Test that Grove auto-selects worktree when launched from a subdirectory."""
@@ -1,6 +1,7 @@
 """Tests for tmux session management integration."""
 
 from pathlib import Path
+from subprocess import CompletedProcess
 from typing import Any
 from unittest.mock import patch, MagicMock
 
@@ -13,45 +14,49 @@ from src import GroveApp, get_active_tmux_sessions
 class TestTmuxIntegration:
     """Tests for tmux session integration."""
 
-    @patch('src.utils.get_tmux_server')
-    def test_get_active_tmux_sessions_success(self, mock_get_server: Any) -> None:
+    @patch('src.utils.subprocess.run')
+    def test_get_active_tmux_sessions_success(self, mock_run: Any) -> None:
         """Test that get_active_tmux_sessions correctly retrieves session names."""
-        # Mock tmux server with sessions
-        mock_server = MagicMock()
-        mock_session1 = MagicMock()
-        mock_session1.name = 'session1'
-        mock_session2 = MagicMock()
-        mock_session2.name = 'session2'
-        mock_session3 = MagicMock()
-        mock_session3.name = 'feature-one'
-
-        mock_server.sessions = [mock_session1, mock_session2, mock_session3]
-        mock_get_server.return_value = mock_server
+        # Mock tmux list-sessions output with one session name per line
+        mock_run.return_value = CompletedProcess(
+            args=[], returncode=0, stdout="session1\nsession2\nfeature-one\n", stderr=""
+        )
 
         sessions = get_active_tmux_sessions()
         expected_sessions = {'session1', 'session2', 'feature-one'}
         assert sessions == expected_sessions
+        assert mock_run.call_args[0][0] == ['tmux', 'list-sessions', '-F', '#{session_name}']
 
-    @patch('src.utils.get_tmux_server')
-    def test_get_active_tmux_sessions_no_sessions(self, mock_get_server: Any) -> None:
-        """Test that get_active_tmux_sessions handles no sessions gracefully."""
-        # Mock tmux server with no sessions
-        mock_server = MagicMock()
-        mock_server.sessions = []
-        mock_get_server.return_value = mock_server
+    @patch('src.utils.subprocess.run')
+    def test_get_active_tmux_sessions_no_sessions(self, mock_run: Any) -> None:
+        """Test that get_active_tmux_sessions handles no running server gracefully."""
+        # tmux exits non-zero when no server is running
+        mock_run.return_value = CompletedProcess(
+            args=[], returncode=1, stdout="", stderr="no server running on /tmp/tmux-1000/default"
+        )
 
         sessions = get_active_tmux_sessions()
         assert sessions == set()
 
-    @patch('src.utils.get_tmux_server')
-    def test_get_active_tmux_sessions_tmux_not_found(self, mock_get_server: Any) -> None:
+    @patch('src.utils.subprocess.run')
+    def test_get_active_tmux_sessions_tmux_not_found(self, mock_run: Any) -> None:
         """Test that get_active_tmux_sessions handles tmux not being available."""
-        # Mock server not available
-        mock_get_server.return_value = None
+        # Mock tmux binary not installed
+        mock_run.side_effect = FileNotFoundError("tmux")
 
         sessions = get_active_tmux_sessions()
         assert sessions == set()
 
+    @patch('src.utils._list_tmux_sessions')
+    def test_session_exists_uses_session_names(self, mock_sessions: Any) -> None:
+        """Test that session_exists checks exact membership in the active session names."""
+        from src.utils import session_exists
+
+        mock_sessions.return_value = {'repo/feature-one-bar'}
+
+        assert session_exists(MagicMock(), 'repo/feature-one-bar') is True
+        assert session_exists(MagicMock(), 'repo/feature-one') is False
+
     @patch('src.widgets.get_active_tmux_sessions')
     async def test_sidebar_with_active_tmux_sessions(self, mock_sessions: Any, change_to_example_repo: Path) -> None:
         """Test that sidebar shows filled circles for directories with active tmux sessions."""
@@ -73,5 +78,292 @@ class TestTmuxIntegration:
                 directory_labels.append(str(label.content))
 
             # Verify feature-one has filled circle and PR indicator, bugfix-01 has empty circle
-            expected_directories = ["○ bugfix-01", "● [bold]PR[/bold] feature-one"]
-            assert directory_labels == expected_directories
\ No newline at end of file
+            expected_directories = ["○ bugfix-01", "● PR feature-one"]
+            assert directory_labels == expected_directories
+
+    async def test_pane_preview_renders_each_window_as_one_widget(self, change_to_example_repo: Path) -> None:
+        """Test that each tmux window is shown by a single childless widget holding title and content."""
+        from src.widgets import TmuxPanePreview, WindowPreview
+
+        windows = [
+            {"window_index": "1", "window_name": "editor", "is_active": True, "content": "$ vim"},
+            {"window_index": "2", "window_name": "shell", "is_active": False, "content": "$ ls"},
+        ]
+        app = GroveApp()
+
+        async with app.run_test() as pilot:
+            # Let startup auto-selection settle so it doesn't replace the preview
+            await pilot.pause()
+            app.query_one(TmuxPanePreview).update_content("preview-only", windows)
+            await pilot.pause()
+
+            previews = list(app.query(WindowPreview))
+            assert len(previews) == 2
+            assert all(not preview.children for preview in previews)
+
+            rendered = [str(preview.render()).splitlines() for preview in previews]
+            assert rendered[0][0].strip() == "*1: editor"
+            assert rendered[0][1] == "$ vim"
+            assert rendered[1][0].strip() == "2: shell"
+
+            # Repaints at the same size reuse the built Text
+            assert previews[0].render() is previews[0].render()
+
+    @patch('src.utils._list_tmux_sessions')
+    def test_session_exists_reuses_session_list(self, mock_sessions: Any) -> None:
+        """Test that session lookups share one session listing until it is invalidated."""
+        from src.utils import invalidate_session_cache, session_exists
+
+        mock_sessions.return_value = {"repo/feature-one"}
+        assert session_exists(MagicMock(), "repo/feature-one") is True
+        assert session_exists(MagicMock(), "repo/bugfix-01") is False
+        assert mock_sessions.call_count == 1
+
+        mock_sessions.return_value = {"repo/feature-one", "repo/bugfix-01"}
+        invalidate_session_cache()
+        assert session_exists(MagicMock(), "repo/bugfix-01") is True
+        assert mock_sessions.call_count == 2
+
+    @patch('src.utils.subprocess.run')
+    def test_get_active_tmux_sessions_reuses_listing(self, mock_run: Any) -> None:
+        """Test that repeated session listings within the TTL spawn tmux only once."""
+        from src.utils import invalidate_session_cache
+
+        mock_run.return_value = CompletedProcess(args=[], returncode=0, stdout="repo/feature-one\n", stderr="")
+        assert get_active_tmux_sessions() == {"repo/feature-one"}
+        assert get_active_tmux_sessions() == {"repo/feature-one"}
+        assert mock_run.call_count == 1
+
+        invalidate_session_cache()
+        get_active_tmux_sessions()
+        assert mock_run.call_count == 2
+
+    @patch('src.utils.threading.Thread')
+    @patch('src.utils.subprocess.Popen')
+    def test_run_hydration_script_prefers_worktree_script(self, mock_popen: Any, mock_thread: Any, tmp_path: Path) -> None:
+        """Test that the worktree's own .tmux-sessionizer wins over the parent's."""
+        from src.utils import _run_hydration_script
+
+        worktree_path = tmp_path / "feature-one"
+        worktree_path.mkdir()
+        (worktree_path / ".tmux-sessionizer").write_text("echo worktree")
+        (tmp_path / ".tmux-sessionizer").write_text("echo parent")
+
+        mock_session = MagicMock()
+        _run_hydration_script(mock_session, worktree_path)
+
+        assert mock_popen.call_args.args[0] == ['bash', '.tmux-sessionizer']
+        assert mock_popen.call_args.kwargs['cwd'] == str(worktree_path)
+        assert mock_popen.call_args.kwargs['start_new_session'] is True
+        mock_thread.return_value.start.assert_called_once()
+
+    @patch('src.utils.threading.Thread')
+    @patch('src.utils.subprocess.Popen')
+    def test_run_hydration_script_detects_newly_added_script(self, mock_popen: Any, mock_thread: Any, tmp_path: Path) -> None:
+        """Test that a script added after a cached miss is picked up."""
+        from src.utils import _run_hydration_script
+
+        worktree_path = tmp_path / "feature-one"
+        worktree_path.mkdir()
+
+        with patch('src.utils._HOME', tmp_path / "home"):
+            mock_session = MagicMock()
+            _run_hydration_script(mock_session, worktree_path)
+            assert not mock_popen.called
+
+            (tmp_path / ".tmux-sessionizer").write_text("echo parent")
+            _run_hydration_script(mock_session, worktree_path)
+
+        assert mock_popen.call_args.kwargs['cwd'] == str(tmp_path)
+
+    @patch('src.utils.threading.Thread')
+    @patch('src.utils.subprocess.Popen')
+    def test_run_hydration_script_targets_new_session(self, mock_popen: Any, mock_thread: Any, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the script's tmux environment points at the new session, not grove's pane."""
+        from src.utils import _run_hydration_script
+
+        monkeypatch.setenv("TMUX", "/tmp/tmux-1000/default,4242,0")
+        monkeypatch.setenv("TMUX_PANE", "%0")
+        worktree_path = tmp_path / "feature-one"
+        worktree_path.mkdir()
+        (worktree_path / ".tmux-sessionizer").write_text("tmux new-window -d")
+
+        mock_session = MagicMock()
+        mock_session.cmd.return_value.stdout = ["/tmp/tmux-1000/default,4242,$7"]
+        _run_hydration_script(mock_session, worktree_path)
+
+        mock_session.cmd.assert_called_once_with('display-message', '-p', '#{socket_path},#{pid},#{session_id}')
+        env = mock_popen.call_args.kwargs['env']
+        assert env["TMUX"] == "/tmp/tmux-1000/default,4242,7"
+        assert "TMUX_PANE" not in env
+
+    @patch('src.utils._run_hydration_script')
+    def test_prepare_new_session_creates_metadata(self, mock_hydrate: Any, tmp_path: Path) -> None:
+        """Test that new-session setup creates an empty pr.md and starts hydration."""
+        from src.utils import _prepare_new_session
+
+        worktree_path = tmp_path / "feature-one"
+        mock_session = MagicMock()
+        _prepare_new_session(mock_session, worktree_path, tmp_path)
+
+        pr_file = tmp_path / ".grove" / "metadata" / "feature-one" / "pr.md"
+        assert pr_file.read_text() == ""
+        mock_hydrate.assert_called_once_with(mock_session, worktree_path)
+
+        # An existing pr.md is left as it is
+        pr_file.write_text("# My PR")
+        _prepare_new_session(mock_session, worktree_path, tmp_path)
+        assert pr_file.read_text() == "# My PR"
+
+    @patch('src.utils.threading.Thread')
+    def test_setup_new_session_defers_preparation(self, mock_thread: Any, change_to_example_repo: Path) -> None:
+        """Test that metadata and hydration setup run off the calling thread."""
+        from src.utils import _prepare_new_session, _setup_new_session
+
+        mock_server = MagicMock()
+        worktree_path = change_to_example_repo / "feature-one"
+        session = _setup_new_session(mock_server, "repo/feature-one", worktree_path)
+
+        assert session is mock_server.new_session.return_value
+        assert mock_thread.call_args.kwargs['target'] is _prepare_new_session
+        mock_thread.return_value.start.assert_called_once()
+
+    def test_report_hydration_result_shows_outcome(self) -> None:
+        """Test that the hydration watcher reports success or failure in the session."""
+        from src.utils import _report_hydration_result
+
+        mock_session = MagicMock()
+        mock_process = MagicMock()
+
+        mock_process.wait.return_value = 0
+        _report_hydration_result(mock_process, mock_session)
+        mock_session.cmd.assert_called_with('display-message', 'Session hydrated successfully')
+
+        mock_process.wait.return_value = 1
+        _report_hydration_result(mock_process, mock_session)
+        mock_session.cmd.assert_called_with('display-message', 'Session hydration failed')
+
+
+class TestTmuxPaneCache:
+    """Tests for the tmux pane preview cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Give each test its own empty pane cache."""
+        from collections import OrderedDict
+
+        monkeypatch.setattr('src.utils._tmux_pane_cache', OrderedDict())
+
+    @patch('src.utils.time.monotonic')
+    @patch('src.utils._fetch_tmux_pane_preview')
+    def test_window_data_cached_for_full_ttl(self, mock_fetch: Any, mock_monotonic: Any) -> None:
+        """Test that window data is served from cache until the TTL elapses."""
+        from src.utils import get_tmux_pane_preview, TMUX_PANE_CACHE_TTL
+
+        windows = [{"window_name": "zsh", "window_index": "1", "content": "$", "is_active": True}]
+        mock_fetch.return_value = windows
+        mock_monotonic.return_value = 100.0
+
+        assert get_tmux_pane_preview("feature-one") == windows
+        mock_monotonic.return_value = 100.0 + TMUX_PANE_CACHE_TTL - 1
+        assert get_tmux_pane_preview("feature-one") == windows
+        assert mock_fetch.call_count == 1
+
+        mock_monotonic.return_value = 100.0 + TMUX_PANE_CACHE_TTL
+        get_tmux_pane_preview("feature-one")
+        assert mock_fetch.call_count == 2
+
+    @patch('src.utils.time.monotonic')
+    @patch('src.utils._fetch_tmux_pane_preview')
+    def test_status_messages_expire_quickly(self, mock_fetch: Any, mock_monotonic: Any) -> None:
+        """Test that status/error strings use the short error TTL."""
+        from src.utils import get_tmux_pane_preview, TMUX_PANE_ERROR_CACHE_TTL
+
+        mock_fetch.return_value = "No active tmux session"
+        mock_monotonic.return_value = 100.0
+
+        get_tmux_pane_preview("feature-one")
+        mock_monotonic.return_value = 100.0 + TMUX_PANE_ERROR_CACHE_TTL
+        get_tmux_pane_preview("feature-one")
+
+        assert mock_fetch.call_count == 2
+
+    @patch('src.utils.TMUX_PANE_CACHE_MAXSIZE', 2)
+    @patch('src.utils._fetch_tmux_pane_preview')
+    def test_cache_evicts_least_recently_used(self, mock_fetch: Any) -> None:
+        """Test that the cache stays bounded by evicting the least recently used entry."""
+        from src import utils
+
+        mock_fetch.return_value = []
+
+        utils.get_tmux_pane_preview("one")
+        utils.get_tmux_pane_preview("two")
+        utils.get_tmux_pane_preview("one")  # Cache hit refreshes 'one'
+        utils.get_tmux_pane_preview("three")
+
+        assert list(utils._tmux_pane_cache) == ["one", "three"]
+
+
+class TestTmuxServer:
+    """Tests for the shared tmux server handle."""
+
+    @patch('libtmux.Server')
+    def test_get_tmux_server_reuses_instance(self, mock_server_cls: Any) -> None:
+        """Test that the server is created once and recreated after a reset."""
+        from src.utils import get_tmux_server, reset_tmux_server
+
+        reset_tmux_server()
+        try:
+            assert get_tmux_server() is get_tmux_server()
+            assert mock_server_cls.call_count == 1
+
+            reset_tmux_server()
+            get_tmux_server()
+            assert mock_server_cls.call_count == 2
+        finally:
+            reset_tmux_server()
+
+
+class TestCaptureAllActivePanes:
+    """Tests for batched tmux pane capture."""
+
+    @patch('src.utils.subprocess.run')
+    def test_capture_all_active_panes_batches_captures(self, mock_run: Any) -> None:
+        """Test that panes are listed once and all captured in one chained tmux call."""
+        from src.utils import capture_all_active_panes, _TMUX_CAPTURE_MARKER
+
+        list_output = "\n".join([
+            "repo/feat\t0\tzsh\t1\t1\t%1",
+            "repo/feat\t1\tlogs\t0\t0\t%2",
+            "repo/feat\t1\tlogs\t0\t1\t%3",
+            "other\t0\tvim\t1\t1\t%4",
+        ])
+        capture_output = f"{_TMUX_CAPTURE_MARKER}\n$ ls\n\n\n{_TMUX_CAPTURE_MARKER}\ntail -f\n"
+        mock_run.side_effect = [
+            CompletedProcess(args=[], returncode=0, stdout=list_output, stderr=""),
+            CompletedProcess(args=[], returncode=0, stdout=capture_output, stderr=""),
+        ]
+
+        previews = capture_all_active_panes({"repo/feat"})
+
+        assert previews == {"repo/feat": [
+            {"window_name": "zsh", "window_index": "0", "is_active": True, "content": "$ ls"},
+            {"window_name": "logs", "window_index": "1", "is_active": False, "content": "tail -f"},
+        ]}
+        assert mock_run.call_count == 2
+        assert mock_run.call_args_list[0][0][0][:5] == ['tmux', 'list-panes', '-s', '-t', '=repo/feat']
+        capture_command = mock_run.call_args_list[1][0][0]
+        assert capture_command.count('capture-pane') == 2
+        # The active pane of the split window is captured, not its first pane
+        assert '%3' in capture_command and '%2' not in capture_command
+
+    @patch('src.utils.subprocess.run')
+    def test_capture_all_active_panes_without_server(self, mock_run: Any) -> None:
+        """Test that no tmux server yields no sessions and no capture call."""
+        from src.utils import capture_all_active_panes
+
+        mock_run.return_value = CompletedProcess(args=[], returncode=1, stdout="", stderr="no server running")
+
+        assert capture_all_active_panes() == {}
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][:3] == ['tmux', 'list-panes', '-a']
@@ -233,7 +233,7 @@ class TestWorktreeDeletion:
             # Verify no modal screen was opened
             assert len(app.screen_stack) == 1
 
-    @patch('src.widgets.get_worktree_pr_status')
+    @patch('src.widgets.scan_worktrees')
     @patch('src.widgets.get_active_tmux_sessions')
     @patch('src.app.get_worktree_directories')
     @patch('src.app.get_worktree_pr_status')
@@ -242,14 +242,16 @@ class TestWorktreeDeletion:
     @patch('src.app.session_exists')
     @patch('src.app.remove_worktree_with_branch')
     @patch('src.utils.get_active_tmux_sessions')
-    async def test_worktree_deletion_successful_without_tmux_session(self, mock_sessions: Any, mock_remove_worktree: Any, mock_session_exists: Any, mock_get_server: Any, mock_app_sessions: Any, mock_app_pr: Any, mock_app_dirs: Any, mock_widgets_sessions: Any, mock_widgets_pr: Any, change_to_example_repo: Path) -> None:
+    async def test_worktree_deletion_successful_without_tmux_session(self, mock_sessions: Any, mock_remove_worktree: Any, mock_session_exists: Any, mock_get_server: Any, mock_app_sessions: Any, mock_app_pr: Any, mock_app_dirs: Any, mock_widgets_sessions: Any, mock_widgets_scan: Any, change_to_example_repo: Path) -> None:
         """Test successful worktree deletion when no corresponding tmux session exists."""
         mock_sessions.return_value = set()  # No active sessions
         mock_app_sessions.return_value = set()  # Mock for sidebar refresh
         mock_app_pr.return_value = set()  # Mock for sidebar refresh
         mock_app_dirs.return_value = []  # Mock for sidebar refresh
         mock_widgets_sessions.return_value = set()  # Mock for Sidebar compose
-        mock_widgets_pr.return_value = set()  # Mock for Sidebar compose
+        mock_widgets_scan.return_value = [  # Mock for Sidebar compose
+            {"name": "ep/test-feature", "path": "/repo/ep/test-feature", "has_pr": False}
+        ]
 
         # Mock successful worktree removal
         mock_remove_worktree.return_value = (True, "")
@@ -272,10 +274,11 @@ class TestWorktreeDeletion:
 
             app.notify = MagicMock(side_effect=mock_notify)
 
-            # Mock sidebar operations
+            # Mock sidebar operations; the deleted worktree is gone on refresh
             sidebar = app.query_one("#sidebar", ListView)
             sidebar.clear = MagicMock()
             sidebar.append = MagicMock()
+            mock_widgets_scan.return_value = []
 
             # Call deletion handler with confirmation
             app.handle_worktree_deletion(True)
@@ -298,7 +301,7 @@ class TestWorktreeDeletion:
             # Verify selected worktree was cleared
             assert app.selected_worktree == ""
 
-    @patch('src.widgets.get_worktree_pr_status')
+    @patch('src.widgets.scan_worktrees')
     @patch('src.widgets.get_active_tmux_sessions')
     @patch('src.app.get_worktree_directories')
     @patch('src.app.get_worktree_pr_status')
@@ -307,14 +310,14 @@ class TestWorktreeDeletion:
     @patch('src.app.session_exists')
     @patch('src.app.remove_worktree_with_branch')
     @patch('src.utils.get_active_tmux_sessions')
-    async def test_worktree_deletion_successful_with_tmux_session(self, mock_sessions: Any, mock_remove_worktree: Any, mock_session_exists: Any, mock_get_server: Any, mock_app_sessions: Any, mock_app_pr: Any, mock_app_dirs: Any, mock_widgets_sessions: Any, mock_widgets_pr: Any, change_to_example_repo: Path) -> None:
+    async def test_worktree_deletion_successful_with_tmux_session(self, mock_sessions: Any, mock_remove_worktree: Any, mock_session_exists: Any, mock_get_server: Any, mock_app_sessions: Any, mock_app_pr: Any, mock_app_dirs: Any, mock_widgets_sessions: Any, mock_widgets_scan: Any, change_to_example_repo: Path) -> None:
         """Test successful worktree deletion when corresponding tmux session exists."""
         mock_sessions.return_value = set()
         mock_app_sessions.return_value = set()  # Mock for sidebar refresh
         mock_app_pr.return_value = set()  # Mock for sidebar refresh
         mock_app_dirs.return_value = []  # Mock for sidebar refresh
         mock_widgets_sessions.return_value = set()  # Mock for Sidebar compose
-        mock_widgets_pr.return_value = set()  # Mock for Sidebar compose
+        mock_widgets_scan.return_value = []  # Mock for Sidebar compose
 
         # Mock successful worktree removal
         mock_remove_worktree.return_value = (True, "")
@@ -361,21 +364,21 @@ class TestWorktreeDeletion:
             assert "and its tmux session deleted successfully" in notifications[0][0]
             assert notifications[0][1] == "information"
 
-    @patch('src.widgets.get_worktree_pr_status')
+    @patch('src.widgets.scan_worktrees')
     @patch('src.widgets.get_active_tmux_sessions')
     @patch('src.app.get_worktree_directories')
     @patch('src.app.get_worktree_pr_status')
     @patch('src.app.get_active_tmux_sessions')
     @patch('src.app.remove_worktree_with_branch')
     @patch('src.utils.get_active_tmux_sessions')
-    async def test_worktree_deletion_handles_worktree_manager_failure(self, mock_sessions: Any, mock_remove_worktree: Any, mock_app_sessions: Any, mock_app_pr: Any, mock_app_dirs: Any, mock_widgets_sessions: Any, mock_widgets_pr: Any, change_to_example_repo: Path) -> None:
+    async def test_worktree_deletion_handles_worktree_manager_failure(self, mock_sessions: Any, mock_remove_worktree: Any, mock_app_sessions: Any, mock_app_pr: Any, mock_app_dirs: Any, mock_widgets_sessions: Any, mock_widgets_scan: Any, change_to_example_repo: Path) -> None:
         """Test that worktree deletion handles worktree removal failure."""
         mock_sessions.return_value = set()
         mock_app_sessions.return_value = set()  # Mock for sidebar refresh (shouldn't be called)
         mock_app_pr.return_value = set()  # Mock for sidebar refresh (shouldn't be called)
         mock_app_dirs.return_value = []  # Mock for sidebar refresh (shouldn't be called)
         mock_widgets_sessions.return_value = set()  # Mock for Sidebar compose
-        mock_widgets_pr.return_value = set()  # Mock for Sidebar compose
+        mock_widgets_scan.return_value = []  # Mock for Sidebar compose
 
         # Mock failed worktree removal
         mock_remove_worktree.return_value = (False, "Git error: Failed to remove worktree")
@@ -663,7 +666,7 @@ class TestDockerCleanupInWorktreeDeletion:
             if worktree_dir.exists():
                 shutil.rmtree(worktree_dir)
 
-    @patch('src.widgets.get_worktree_pr_status')
+    @patch('src.widgets.scan_worktrees')
     @patch('src.widgets.get_active_tmux_sessions')
     @patch('src.app.get_worktree_directories')
     @patch('src.app.get_worktree_pr_status')
@@ -672,14 +675,14 @@ class TestDockerCleanupInWorktreeDeletion:
     @patch('src.app.session_exists')
     @patch('src.app.remove_worktree_with_branch')
     @patch('src.utils.get_active_tmux_sessions')
-    async def test_worktree_deletion_displays_docker_cleanup_warning(self, mock_sessions: Any, mock_remove_worktree: Any, mock_session_exists: Any, mock_get_server: Any, mock_app_sessions: Any, mock_app_pr: Any, mock_app_dirs: Any, mock_widgets_sessions: Any, mock_widgets_pr: Any, change_to_example_repo: Path) -> None:
+    async def test_worktree_deletion_displays_docker_cleanup_warning(self, mock_sessions: Any, mock_remove_worktree: Any, mock_session_exists: Any, mock_get_server: Any, mock_app_sessions: Any, mock_app_pr: Any, mock_app_dirs: Any, mock_widgets_sessions: Any, mock_widgets_scan: Any, change_to_example_repo: Path) -> None:
         """Test that worktree deletion displays Docker cleanup warnings in notifications."""
         mock_sessions.return_value = set()
         mock_app_sessions.return_value = set()
         mock_app_pr.return_value = set()
         mock_app_dirs.return_value = []
         mock_widgets_sessions.return_value = set()
-        mock_widgets_pr.return_value = set()
+        mock_widgets_scan.return_value = []
 
         # Mock worktree removal with Docker cleanup warning
         mock_remove_worktree.return_value = (True, "Worktree removed. Docker cleanup had warnings: Container not found")
@@ -712,4 +715,121 @@ class TestDockerCleanupInWorktreeDeletion:
             # Verify warning notification was shown
             assert len(notifications) == 1
             assert "Docker cleanup" in notifications[0][0]
-            assert notifications[0][1] == "warning"
\ No newline at end of file
+            assert notifications[0][1] == "warning"
+
+
+class TestWorktreeRegistration:
+    """Tests for registered worktree detection during removal."""
+
+    def test_list_registered_worktrees_parses_porcelain(self) -> None:
+        """Test that worktree paths are parsed from NUL-delimited porcelain output."""
+        from src.utils import list_registered_worktrees
+
+        mock_repo = MagicMock()
+        mock_repo.git.worktree.return_value = (
+            "worktree /repo/.bare\0bare\0\0"
+            "worktree /repo/foo-bar\0HEAD abc123\0branch refs/heads/foo-bar\0\0"
+        )
+
+        paths = list_registered_worktrees(mock_repo)
+
+        assert paths == {"/repo/.bare", "/repo/foo-bar"}
+        mock_repo.git.worktree.assert_called_once_with(
+            'list', '--porcelain', '-z', strip_newline_in_stdout=False
+        )
+
+    def test_remove_worktree_directory_ignores_substring_matches(self, tmp_path: Path) -> None:
+        """Test that a worktree whose name is a substring of another is not treated as registered."""
+        from src.utils import _remove_worktree_directory
+
+        mock_repo = MagicMock()
+        mock_repo.git.worktree.return_value = f"worktree {tmp_path / 'foo-bar'}\0branch refs/heads/foo-bar\0\0"
+
+        success, error_msg = _remove_worktree_directory(mock_repo, tmp_path / "foo")
+
+        assert success is True
+        assert error_msg == ""
+        # Only 'list' and 'prune' should run - 'remove' must not be called for 'foo'
+        called_subcommands = [call.args[0] for call in mock_repo.git.worktree.call_args_list]
+        assert called_subcommands == ['list', 'prune']
+
+    def test_remove_worktree_directory_uses_prefetched_registrations(self, tmp_path: Path) -> None:
+        """Test that a prefetched set of registered worktrees skips listing them again."""
+        from src.utils import _remove_worktree_directory
+
+        mock_repo = MagicMock()
+        worktree_dir = tmp_path / "foo"
+
+        success, _ = _remove_worktree_directory(mock_repo, worktree_dir, {str(worktree_dir)})
+
+        assert success is True
+        called_subcommands = [call.args[0] for call in mock_repo.git.worktree.call_args_list]
+        assert called_subcommands == ['remove', 'prune']
+
+    def test_remove_worktree_directory_matches_resolved_path(self, tmp_path: Path) -> None:
+        """Test that a worktree reached through a symlinked repo root is still found registered."""
+        from src.utils import _remove_worktree_directory
+
+        (tmp_path / "real" / "foo").mkdir(parents=True)
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        mock_repo = MagicMock()
+
+        success, _ = _remove_worktree_directory(mock_repo, tmp_path / "link" / "foo",
+                                                {str(tmp_path / "real" / "foo")})
+
+        assert success is True
+        called_subcommands = [call.args[0] for call in mock_repo.git.worktree.call_args_list]
+        assert called_subcommands == ['remove', 'prune']
+
+    @patch('src.utils._remove_worktree_directory')
+    @patch('src.utils._repo_for')
+    @patch('src.utils._stop_docker_containers')
+    def test_docker_stop_finishes_before_directory_removal(self, mock_docker_stop: Any, mock_repo_for: Any,
+                                                          mock_remove_dir: Any, tmp_path: Path) -> None:
+        """Test that Docker is stopped off-thread but always before the worktree directory is removed."""
+        import threading
+        import time
+        from src.config import set_active_repo
+        from src.utils import remove_worktree_with_branch
+
+        (tmp_path / ".bare").mkdir()
+        set_active_repo(tmp_path)
+        events = []
+
+        def slow_docker_stop(worktree_dir: Path) -> str:
+            time.sleep(0.05)
+            events.append(("docker", threading.current_thread() is threading.main_thread()))
+            return "Docker cleanup failed: boom"
+
+        def record_removal(*args: Any) -> tuple[bool, str]:
+            events.append(("remove", True))
+            return True, ""
+
+        mock_docker_stop.side_effect = slow_docker_stop
+        mock_remove_dir.side_effect = record_removal
+        mock_repo_for.return_value.git.worktree.return_value = ""
+
+        success, message = remove_worktree_with_branch("foo")
+
+        assert success is True
+        assert "Docker cleanup failed: boom" in message
+        assert events == [("docker", False), ("remove", True)]
+
+    def test_fast_rmtree_removes_tree_without_following_symlinks(self, tmp_path: Path) -> None:
+        """Test that the scandir-based remover deletes nested trees but leaves symlink targets alone."""
+        from src.utils import _fast_rmtree
+
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+
+        tree = tmp_path / "worktree"
+        (tree / "node_modules" / "pkg" / "lib").mkdir(parents=True)
+        (tree / "node_modules" / "pkg" / "lib" / "index.js").write_text("")
+        (tree / "README.md").write_text("")
+        (tree / "linked").symlink_to(outside)
+
+        _fast_rmtree(tree)
+
+        assert not tree.exists()
+        assert (outside / "keep.txt").read_text() == "keep"